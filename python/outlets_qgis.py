@@ -15,55 +15,19 @@ import sys
 import json
 import time
 import logging
+import hashlib
 import tempfile
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
 from pathlib import Path
 from datetime import datetime
 
+import numpy as np
+
 # Set Qt to use offscreen platform for headless operation
 os.environ['QT_QPA_PLATFORM'] = 'offscreen'
 
-from qgis.core import (
-    QgsApplication,
-    QgsVectorLayer,
-    QgsRasterLayer,
-    QgsProject,
-    QgsLayoutExporter,
-    QgsLayoutItemMap,
-    QgsLayoutItemLegend,
-    QgsLayoutItemScaleBar,
-    QgsLayoutItemLabel,
-    QgsLayoutItemShape,
-    QgsLayoutItemPage,
-    QgsLayoutPoint,
-    QgsLayoutSize,
-    QgsLayoutMeasurement,
-    QgsPrintLayout,
-    QgsScaleBarSettings,
-    QgsUnitTypes,
-    QgsRectangle,
-    QgsCoordinateReferenceSystem,
-    QgsCoordinateTransform,
-    QgsSymbol,
-    QgsSymbolLayer,
-    QgsRendererCategory,
-    QgsCategorizedSymbolRenderer,
-    QgsSingleSymbolRenderer,
-    QgsSimpleLineSymbolLayer,
-    QgsSimpleFillSymbolLayer,
-    QgsSimpleMarkerSymbolLayer,
-    QgsTextFormat,
-    QgsTextBackgroundSettings,
-    QgsVectorLayerSimpleLabeling,
-    QgsPalLayerSettings,
-    QgsProperty,
-    QgsLayerTreeLayer,
-    QgsLabeling,
-    QgsGeometry,
-    QgsPointXY
-)
-from qgis.PyQt.QtGui import QColor, QFont
-from qgis.PyQt.QtCore import QSizeF
-
 # Import local modules
 try:
     from . import versioning
@@ -72,6 +36,67 @@ except ImportError:
     import versioning
     import utils
 
+# Optional: ijson lets GeoJSON features be parsed incrementally
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+# Optional: orjson serializes JSON several times faster than the json module
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Optional: psutil adds bytes read to the per-region stage summaries
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+# Not available on Windows; only used for peak memory in stage summaries
+try:
+    import resource
+except ImportError:
+    resource = None
+
+# Errors raised while parsing GeoJSON with either parser
+GEOJSON_ERRORS = (json.JSONDecodeError, ijson.JSONError) if ijson else (json.JSONDecodeError,)
+
+# OGR GeoJSON driver open options for source layers: keep nested
+# attributes as-is and don't retain each feature's native JSON
+GEOJSON_OPEN_OPTIONS = ['FLATTEN_NESTED_ATTRIBUTES=NO', 'NATIVE_DATA=NO']
+
+# GeoPDF export failures after which a layout's remaining regions are
+# exported straight to rasterized PDF (GeoPDF failures are usually systematic)
+GEOPDF_MAX_FAILURES = 2
+
+# Metadata fields GRASS adds to feature properties, dropped by clean_grass_geojson()
+_GRASS_FIELDS = ('cat', 'fid', 'ogc_fid', 'gml_id')
+
+# QgsLayoutExporter.ExportResult names, for error messages
+_PDF_EXPORT_ERROR_CODES = {
+    0: "Success",
+    1: "Canceled",
+    2: "MemoryError",
+    3: "FileError",
+    4: "PrintError",
+    5: "SvgLayerError",
+    6: "IteratorError"
+}
+
+# Most loaded layers kept across outlets; least recently used go first
+LAYER_CACHE_SIZE = 32
+
+# Field added to in-memory layers with deduplicated labels; set to 1 on the
+# feature that carries each label value within the current region
+LABEL_KEEP_FIELD = '_label_keep'
+
+# Field added to in-memory layers; set to 1 on the features of the current
+# region, so the region subset string is the same constant for every region
+REGION_FIELD = '_in_region'
+REGION_SUBSET = f'"{REGION_FIELD}" = 1'
+
 #logger = logging.getLogger(__name__)
 
 # Configure logging
@@ -85,17 +110,224 @@ logger.setLevel(logging.INFO)
 # Global QGIS application instance
 _qgs_app = None
 
+# Styled renderer prototypes keyed by _symbol_cache_key()
+_renderer_cache = {}
+
+# Loaded layers keyed by (layer name, source path, mtime_ns, size, rendered attributes)
+_layer_cache = {}
+
+# Coordinate transforms keyed by (source CRS, destination CRS)
+_transform_cache = {}
+
+# CRSs built from an auth id, keyed by it, created by _crs()
+_crs_by_authid = {}
+
+# Shared GeoPDF export settings keyed by dpi, built on first use by _geopdf_settings()
+_pdf_settings = {}
+
+# QgsSymbol.defaultSymbol() prototypes, keyed by geometry type
+_default_symbols = {}
+
+# Fonts shared by the collar and labels, keyed by (family, size, bold)
+_fonts = {}
+
+# Data-defined '"vector_width" * feature_scale' stroke widths, keyed by feature_scale
+_vector_width_props = {}
+
+# Whether a layer has a vector_width field, keyed by layer id
+_vector_width_fields = {}
+
+# KD-tree indexes of single-point layers, keyed by layer id
+_point_indexes = {}
+
+# Label attribute of layers deduplicated through LABEL_KEEP_FIELD, keyed by layer id
+_label_keep_layers = {}
 
-def qgis_init():
-    """Initialize QGIS application for headless operation."""
+# Feature ids currently flagged in REGION_FIELD, keyed by layer id
+_region_fids = {}
+
+# Label settings keyed by (_config_digest(layer_config), label attribute,
+# whether labels are deduplicated through LABEL_KEEP_FIELD)
+_labeling_cache = {}
+
+# Project, layers and config used by _render_region(); set in the parent
+# before forking render workers, or by _init_render_worker()
+_render_context = None
+
+# (page_size, page_orientation) -> (page name, QgsLayoutItemPage orientation)
+_PAGE_SPEC = {
+    ('A4', 'Portrait'): ('A4', 'Portrait'),
+    ('A4', 'Landscape'): ('A4', 'Landscape'),
+    ('Letter', 'Portrait'): ('Letter', 'Portrait'),
+    ('Letter', 'Landscape'): ('Letter', 'Landscape'),
+}
+
+# (page_size, page_orientation) -> (page width, page height) in mm;
+# anything else is laid out as A4 portrait
+_PAGE_DIMS = {
+    ('A4', 'Portrait'): (210, 297),
+    ('A4', 'Landscape'): (297, 210),
+    ('Letter', 'Portrait'): (215.9, 279.4),  # 8.5 x 11 inches
+    ('Letter', 'Landscape'): (279.4, 215.9),
+}
+
+
+def _import_qgis():
+    """
+    Import the QGIS/Qt classes used by this module into module globals.
+
+    QGIS and its Qt libraries take a noticeable time to load, so they are only
+    imported once an outlet actually needs them (see qgis_init) rather than
+    whenever this module is imported.
+    """
+    global QgsApplication, QgsVectorLayer, QgsRasterLayer, QgsProject, \
+        QgsLayoutExporter, QgsLayoutItemMap, QgsLayoutItemLegend, \
+        QgsLayoutItemScaleBar, QgsLayoutItemLabel, QgsLayoutItemShape, \
+        QgsLayoutItemPage, QgsLayoutPoint, QgsLayoutSize, QgsLayoutMeasurement, \
+        QgsPrintLayout, QgsScaleBarSettings, QgsUnitTypes, QgsRectangle, \
+        QgsCoordinateReferenceSystem, QgsCoordinateTransform, QgsSymbol, \
+        QgsSymbolLayer, QgsRendererCategory, QgsCategorizedSymbolRenderer, \
+        QgsSingleSymbolRenderer, QgsSimpleLineSymbolLayer, \
+        QgsSimpleFillSymbolLayer, QgsSimpleMarkerSymbolLayer, QgsFillSymbol, QgsTextFormat, \
+        QgsTextBackgroundSettings, QgsVectorLayerSimpleLabeling, \
+        QgsPalLayerSettings, QgsProperty, QgsLayerTreeLayer, QgsLabeling, \
+        QgsPointXY, QgsAbstractLayoutIterator, QgsFeatureRequest, \
+        QgsVectorDataProvider, QgsSpatialIndexKDBush, QgsWkbTypes, QgsField, \
+        QgsMapClippingRegion, QColor, QFont, QSizeF, QVariant
+    from qgis.core import (
+        QgsApplication,
+        QgsVectorLayer,
+        QgsRasterLayer,
+        QgsProject,
+        QgsLayoutExporter,
+        QgsLayoutItemMap,
+        QgsLayoutItemLegend,
+        QgsLayoutItemScaleBar,
+        QgsLayoutItemLabel,
+        QgsLayoutItemShape,
+        QgsLayoutItemPage,
+        QgsLayoutPoint,
+        QgsLayoutSize,
+        QgsLayoutMeasurement,
+        QgsPrintLayout,
+        QgsScaleBarSettings,
+        QgsUnitTypes,
+        QgsRectangle,
+        QgsCoordinateReferenceSystem,
+        QgsCoordinateTransform,
+        QgsSymbol,
+        QgsSymbolLayer,
+        QgsRendererCategory,
+        QgsCategorizedSymbolRenderer,
+        QgsSingleSymbolRenderer,
+        QgsSimpleLineSymbolLayer,
+        QgsSimpleFillSymbolLayer,
+        QgsSimpleMarkerSymbolLayer,
+        QgsFillSymbol,
+        QgsTextFormat,
+        QgsTextBackgroundSettings,
+        QgsVectorLayerSimpleLabeling,
+        QgsPalLayerSettings,
+        QgsProperty,
+        QgsLayerTreeLayer,
+        QgsLabeling,
+        QgsPointXY,
+        QgsAbstractLayoutIterator,
+        QgsFeatureRequest,
+        QgsVectorDataProvider,
+        QgsSpatialIndexKDBush,
+        QgsWkbTypes,
+        QgsField,
+        QgsMapClippingRegion
+    )
+    from qgis.PyQt.QtGui import QColor, QFont
+    from qgis.PyQt.QtCore import QSizeF, QVariant
+
+
+def qgis_init(max_threads=None):
+    """
+    Initialize QGIS application for headless operation.
+    
+    Args:
+        max_threads: Threads QGIS may use for rendering and labeling
+            (default: one per CPU on first initialization)
+    """
     global _qgs_app
     if _qgs_app is None:
+        _import_qgis()
         _qgs_app = QgsApplication([], False)
         _qgs_app.initQgis()
+        if max_threads is None:
+            max_threads = os.cpu_count() or 1
+        
+        # Open PROJ's database once up front (initQgis has already registered
+        # the GDAL/OGR drivers); WGS84 -> Web Mercator is also the transform
+        # used to render layers in geographic CRSs
+        try:
+            _crs_transform(_wgs84(), _crs("EPSG:3857")).transform(QgsPointXY(0, 0))
+        except Exception as e:
+            logger.debug("Could not warm up coordinate transforms: %s", e)
         logger.info("QGIS application initialized")
+    if max_threads is not None:
+        QgsApplication.setMaxThreads(max_threads)
     return _qgs_app
 
 
+def dump_json_bytes(obj, indent=False):
+    """
+    Serialize an object to JSON bytes, using orjson when it is installed.
+    
+    Args:
+        obj: JSON-serializable object
+        indent: Indent nested values by two spaces
+        
+    Returns:
+        UTF-8 encoded JSON
+    """
+    if orjson is not None:
+        option = orjson.OPT_SERIALIZE_NUMPY | (orjson.OPT_INDENT_2 if indent else 0)
+        return orjson.dumps(obj, option=option)
+    return json.dumps(obj, indent=2 if indent else None).encode('utf-8')
+
+
+def load_json_bytes(data):
+    """
+    Parse JSON from bytes, using orjson when it is installed.
+    
+    Args:
+        data: UTF-8 encoded JSON
+        
+    Returns:
+        Parsed object
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def iter_geojson_features(geojson_path, stream=True):
+    """
+    Yield the features of a GeoJSON FeatureCollection.
+    
+    When streaming with ijson installed features are parsed one at a time,
+    so memory stays flat and callers that stop early skip reading the rest
+    of the file. Otherwise the whole file is decoded at once, which is
+    faster for files that comfortably fit in memory.
+    
+    Args:
+        geojson_path: Path to GeoJSON file
+        stream: Parse features incrementally if ijson is available
+        
+    Yields:
+        Feature dicts
+    """
+    with open(geojson_path, 'rb') as f:
+        if stream and ijson is not None:
+            yield from ijson.items(f, 'features.item', use_float=True)
+        else:
+            yield from load_json_bytes(f.read()).get('features', [])
+
+
 def load_regions_from_geojson(geojson_path, first_n=0):
     """
     Load regions directly from a GeoJSON file.
@@ -109,70 +341,118 @@ def load_regions_from_geojson(geojson_path, first_n=0):
     """
     geojson_path = Path(geojson_path)
     if not geojson_path.exists():
-        logger.error(f"Regions GeoJSON not found: {geojson_path}")
+        logger.error("Regions GeoJSON not found: %s", geojson_path)
         return []
     
     regions = []
+    corners = []
     
     try:
-        with open(geojson_path, 'r') as f:
-            geojson_data = json.load(f)
-    except json.JSONDecodeError as e:
-        logger.error(f"Failed to parse regions GeoJSON: {e}")
-        return []
-    
-    features = geojson_data.get('features', [])
-    logger.info(f"Found {len(features)} feature(s) in regions GeoJSON")
-    
-    for i, feature in enumerate(features):
-        # Apply first_n limit
-        if first_n > 0 and i >= first_n:
-            logger.info(f"Reached limit of {first_n} regions, stopping")
-            break
+        # Region files are small, so decode them whole unless only the
+        # first few features are wanted
+        for i, feature in enumerate(iter_geojson_features(geojson_path, stream=first_n > 0)):
+            # Apply first_n limit
+            if first_n > 0 and i >= first_n:
+                logger.info("Reached limit of %s regions, stopping", first_n)
+                break
         
-        try:
-            # Extract bbox from geometry coordinates
-            coords = feature['geometry']['coordinates'][0]
-            bbox = utils.geojson_to_bbox(coords)
+            try:
+                # Collect the ring's corner points; bboxes are computed for all
+                # regions at once below
+                coords = feature['geometry']['coordinates'][0]
+                region_corners = [(c[0], c[1]) for c in coords[:4]]
+                if len(region_corners) < 4:
+                    raise IndexError("region ring has fewer than 4 coordinates")
             
-            # Get properties
-            props = feature.get('properties', {})
-            default_name = f"Region_{i}"
-            name = props.get('name', props.get('Description', default_name))
-            caption = props.get('caption', props.get('Description', default_name))
+                # Get properties
+                props = feature.get('properties', {})
+                description = props.get('Description', f"Region_{i}")
+                name = props.get('name', description)
+                caption = props.get('caption', description)
             
-            region = {
-                'name': utils.canonicalize_name(name),
-                'caption': caption,
-                'text': props.get('text', caption),
-                'bbox': bbox,
-                'neighbors': props.get('neighbors'),
-                'vectors': [],
-                'raster': '',
-                'properties': props  # Keep all properties for reference
-            }
+                region = {
+                    'name': utils.canonicalize_name(name),
+                    'caption': caption,
+                    'text': props.get('text', caption),
+                    'bbox': None,
+                    'neighbors': props.get('neighbors'),
+                    'vectors': [],
+                    'raster': '',
+                    'properties': props  # Keep all properties for reference
+                }
             
-            regions.append(region)
-            logger.debug(f"Loaded region {i}: {region['name']}")
+                regions.append(region)
+                corners.append(region_corners)
+                logger.debug("Loaded region %s: %s", i, region['name'])
             
-        except (KeyError, IndexError, TypeError) as e:
-            logger.warning(f"Skipping malformed region feature {i}: {e}")
-            continue
+            except (KeyError, IndexError, TypeError) as e:
+                logger.warning("Skipping malformed region feature %s: %s", i, e)
+                continue
+    except GEOJSON_ERRORS as e:
+        logger.error("Failed to parse regions GeoJSON: %s", e)
+        return []
     
-    # Set up neighbor links if not already present
-    for i, r in enumerate(regions):
-        if r['neighbors'] is None:
-            next_idx = (i + 1) % len(regions)
-            prev_idx = (i - 1) % len(regions)
-            r['neighbors'] = {
-                "prev": regions[prev_idx]['name'],
-                "next": regions[next_idx]['name']
+    # Same bounds as utils.geojson_to_bbox, reduced over all regions in one pass
+    if regions:
+        corners = np.asarray(corners, dtype=float)
+        bounds = np.hstack([corners.min(axis=1), corners.max(axis=1)])
+        for region, (west, south, east, north) in zip(regions, bounds.tolist()):
+            region['bbox'] = {
+                "west": west,
+                "east": east,
+                "north": north,
+                "south": south
             }
     
-    logger.info(f"Loaded {len(regions)} region(s) from GeoJSON")
+    # Set up neighbor links if not already present
+    if any(r['neighbors'] is None for r in regions):
+        # Each region's previous and next names, wrapping around at the ends
+        names = [r['name'] for r in regions]
+        prevs = names[-1:] + names[:-1]
+        nexts = names[1:] + names[:1]
+        for r, prev_name, next_name in zip(regions, prevs, nexts):
+            if r['neighbors'] is None:
+                r['neighbors'] = {"prev": prev_name, "next": next_name}
+    
+    logger.info("Loaded %s region(s) from GeoJSON", len(regions))
     return regions
 
 
+def regions_bbox_array(regions):
+    """
+    Stack region bboxes into one array for vectorized overlap tests.
+    
+    Args:
+        regions: List of region dicts with bbox
+        
+    Returns:
+        (N, 4) float array of west, south, east, north per region
+    """
+    return np.array([
+        [r['bbox']['west'], r['bbox']['south'], r['bbox']['east'], r['bbox']['north']]
+        for r in regions
+    ], dtype=float).reshape(-1, 4)
+
+
+def bbox_overlaps(a, b):
+    """
+    Pairwise bbox intersection test.
+    
+    Args:
+        a: (N, 4) array of west, south, east, north
+        b: (M, 4) array of west, south, east, north
+        
+    Returns:
+        (N, M) bool array, True where a[i] and b[j] intersect (touching counts)
+    """
+    a = a[:, None, :]
+    b = b[None, :, :]
+    return (
+        (a[..., 0] <= b[..., 2]) & (a[..., 2] >= b[..., 0]) &
+        (a[..., 1] <= b[..., 3]) & (a[..., 3] >= b[..., 1])
+    )
+
+
 def qgis_cleanup():
     """Cleanup QGIS application (note: may cause segfaults in offscreen mode)."""
     global _qgs_app
@@ -180,6 +460,97 @@ def qgis_cleanup():
         # Note: Skipping exitQgis() to avoid segfault in offscreen mode
         # The process will clean up on exit anyway
         logger.info("QGIS cleanup requested (skipping exitQgis)")
+    # Every cache below holds QGIS objects, which must not outlive the
+    # application they were created under
+    _renderer_cache.clear()
+    _labeling_cache.clear()
+    _layer_cache.clear()
+    _transform_cache.clear()
+    _crs_by_authid.clear()
+    _pdf_settings.clear()
+    _default_symbols.clear()
+    _fonts.clear()
+    _vector_width_props.clear()
+    _vector_width_fields.clear()
+    _point_indexes.clear()
+    _label_keep_layers.clear()
+    _region_fids.clear()
+
+
+def _crs_transform(src_crs, dst_crs):
+    """
+    Cached transform between two CRSs.
+    
+    Building a QgsCoordinateTransform sets up PROJ state, so one is kept per
+    CRS pair instead of being built for every region and layer.
+    """
+    key = (src_crs.authid() or src_crs.toWkt(), dst_crs.authid() or dst_crs.toWkt())
+    transform = _transform_cache.get(key)
+    if transform is None:
+        transform = QgsCoordinateTransform(src_crs, dst_crs, QgsProject.instance())
+        _transform_cache[key] = transform
+    return transform
+
+
+def _crs(authid):
+    """Shared CRS for an auth id such as 'EPSG:3857', created on first use."""
+    crs = _crs_by_authid.get(authid)
+    if crs is None:
+        crs = _crs_by_authid[authid] = QgsCoordinateReferenceSystem(authid)
+    return crs
+
+
+def _wgs84():
+    """Shared WGS84 CRS (the CRS of region bboxes)."""
+    return _crs("EPSG:4326")
+
+
+def _bbox_transform(crs):
+    """Transform from WGS84 (the CRS of region bboxes) to a layer CRS."""
+    return _crs_transform(_wgs84(), crs)
+
+
+def detach_cached_layers(project):
+    """
+    Take cached layers back out of a project before it is cleared.
+    
+    A project owns the layers added to it and deletes them on clear(), which
+    would leave dangling entries in the layer cache.
+    
+    Args:
+        project: QgsProject that cached layers may have been added to
+    """
+    for layer in _layer_cache.values():
+        if project.mapLayer(layer.id()) is not None:
+            project.takeMapLayer(layer)
+
+
+def read_geojson_header(geojson_path):
+    """
+    Read the top-level members that precede 'features' in a GeoJSON file.
+    
+    Parsing stops at the features array, so only the header (type, name,
+    crs, ...) is read however large the file is.
+    
+    Args:
+        geojson_path: Path to GeoJSON file
+        
+    Returns:
+        Dict of top-level members other than 'features'
+    """
+    header = {}
+    key, builder = None, None
+    with open(geojson_path, 'rb') as f:
+        for prefix, event, value in ijson.parse(f, use_float=True):
+            if prefix == '' and event in ('map_key', 'end_map'):
+                if builder is not None:
+                    header[key] = builder.value
+                if event == 'end_map' or value == 'features':
+                    break
+                key, builder = value, ijson.ObjectBuilder()
+            elif builder is not None:
+                builder.event(event, value)
+    return header
 
 
 def clean_grass_geojson(geojson_path, temp_path):
@@ -196,125 +567,459 @@ def clean_grass_geojson(geojson_path, temp_path):
     Returns:
         True if cleaning was successful, False otherwise
     """
+    temp_path = Path(temp_path)
+    
+    # Written under a temporary name so an interrupted run never leaves a
+    # truncated file that looks up to date
+    partial_path = temp_path.with_name(f"{temp_path.stem}.partial{temp_path.suffix}")
     try:
-        with open(geojson_path, 'r') as f:
-            data = json.load(f)
-        
-        # Clean each feature
-        cleaned_features = []
-        for feature in data.get('features', []):
-            # Remove 'id' at feature level (GRASS adds this)
-            if 'id' in feature:
-                del feature['id']
-            
-            # Remove GRASS-specific fields from properties
-            props = feature.get('properties', {})
-            grass_fields = ['cat', 'fid', 'ogc_fid', 'gml_id']
-            for field in grass_fields:
-                if field in props:
-                    del props[field]
-            
-            cleaned_features.append(feature)
-        
-        # Write cleaned version
-        data['features'] = cleaned_features
-        with open(temp_path, 'w') as f:
-            json.dump(data, f)
-        
-        logger.debug(f"Cleaned {len(cleaned_features)} features, removed GRASS metadata")
+        if ijson is not None:
+            header = read_geojson_header(geojson_path)
+            features = iter_geojson_features(geojson_path)
+        else:
+            with open(geojson_path, 'rb') as f:
+                data = load_json_bytes(f.read())
+            features = data.pop('features', [])
+            header = data
+        
+        # Write the cleaned collection one feature per line as it is read
+        header["type"] = "FeatureCollection"
+        count = 0
+        with open(partial_path, 'wb') as f:
+            f.write(dump_json_bytes(header)[:-1] + b', "features": [\n')
+            for feature in features:
+                # Remove 'id' at feature level (GRASS adds this)
+                feature.pop('id', None)
+                
+                # Remove GRASS-specific fields from properties
+                props = feature.get('properties')
+                if props:
+                    for field in _GRASS_FIELDS:
+                        props.pop(field, None)
+                
+                if count:
+                    f.write(b',\n')
+                f.write(dump_json_bytes(feature))
+                count += 1
+            f.write(b'\n]}\n')
+        os.replace(partial_path, temp_path)
+        
+        logger.debug("Cleaned %s features, removed GRASS metadata", count)
         return True
         
     except Exception as e:
-        logger.error(f"Failed to clean GeoJSON: {e}")
+        logger.error("Failed to clean GeoJSON: %s", e)
+        partial_path.unlink(missing_ok=True)
         return False
 
 
-def load_full_layer(layer_config, config):
+def _cache_layer(cache_key, layer):
+    """
+    Cache a loaded layer, dropping entries for older versions of its source
+    and the least recently used layers beyond LAYER_CACHE_SIZE.
+    """
+    if cache_key is None:
+        return
+    stale = [k for k in _layer_cache if k[:2] == cache_key[:2]]
+    live = [k for k in _layer_cache if k[:2] != cache_key[:2]]
+    stale += live[:max(0, len(live) + 1 - LAYER_CACHE_SIZE)]
+    for key in stale:
+        layer_id = _layer_cache.pop(key).id()
+        _point_indexes.pop(layer_id, None)
+        _label_keep_layers.pop(layer_id, None)
+        _region_fids.pop(layer_id, None)
+        _vector_width_fields.pop(layer_id, None)
+    _layer_cache[cache_key] = layer
+
+
+def cog_raster_path(layer_name, layer_path, src_stat=None):
+    """
+    Get a Cloud-Optimized GeoTIFF version of a raster layer.
+    
+    Plain strip-organized GeoTIFFs make GDAL read whole rows even for a small
+    region. Non-COG sources are converted into a tiled, compressed COG with
+    overviews in the temp directory, once per version of the source.
+    
+    Args:
+        layer_name: Name of the layer (used for the converted file name)
+        layer_path: Path to the source GeoTIFF
+        src_stat: Optional os.stat_result of the source
+        
+    Returns:
+        Path to load: the COG copy, or the source itself if it already is a
+        COG or can't be converted
+    """
+    try:
+        from osgeo import gdal
+    except ImportError:
+        return layer_path
+    
+    if src_stat is None:
+        return layer_path
+    cog_path = staged_copy_path(layer_name, layer_path, src_stat, '_cog.tiff')
+    if cog_path.exists():
+        logger.debug("Using previously converted COG: %s", cog_path)
+        return cog_path
+    
+    partial_path = cog_path.with_suffix('.partial.tiff')
+    try:
+        ds = gdal.Open(str(layer_path))
+        if ds is None:
+            return layer_path
+        if ds.GetMetadata('IMAGE_STRUCTURE').get('LAYOUT') == 'COG':
+            return layer_path
+        ds = None
+        
+        logger.info("Converting %s to a Cloud-Optimized GeoTIFF", layer_name)
+        options = '-of COG -co COMPRESS=DEFLATE -co BLOCKSIZE=512 -co OVERVIEW_RESAMPLING=AVERAGE'
+        out_ds = gdal.Translate(str(partial_path), str(layer_path), options=options)
+        if out_ds is None:
+            raise RuntimeError(gdal.GetLastErrorMsg())
+        out_ds = None  # Flush and close before moving into place
+        os.replace(partial_path, cog_path)
+        return cog_path
+    except RuntimeError as e:
+        logger.warning("Could not convert %s to COG, using original: %s", layer_name, e)
+        partial_path.unlink(missing_ok=True)
+        return layer_path
+
+
+def staged_copy_path(layer_name, source_path, src_stat, suffix):
+    """
+    Temp-directory path for a converted copy of one version of a source file.
+    
+    The name carries a digest of the resolved source path, size and mtime,
+    so layers of the same name from different atlases or versions never
+    share a copy, and a changed source gets a new one. An existing file at
+    this path is therefore always a copy of exactly this source.
+    
+    Args:
+        layer_name: Name of the layer (kept in the file name for readability)
+        source_path: Path to the source file
+        src_stat: os.stat_result of the source
+        suffix: File name ending, such as '.fgb'
+        
+    Returns:
+        Path in the temp directory (the directory is created if needed)
+    """
+    key = f"{Path(source_path).resolve()}|{src_stat.st_size}|{src_stat.st_mtime_ns}"
+    digest = hashlib.sha1(key.encode('utf-8')).hexdigest()[:16]
+    temp_dir = Path(tempfile.gettempdir()) / "stewardship_atlas_qgis"
+    temp_dir.mkdir(exist_ok=True)
+    return temp_dir / f"{layer_name}_{digest}{suffix}"
+
+
+def fgb_vector_path(layer_name, layer_path, src_stat=None):
+    """
+    Get a FlatGeobuf copy of a GeoJSON vector layer.
+    
+    GeoJSON has to be parsed in full on every open; FlatGeobuf is a binary
+    format with a packed R-tree that OGR reads much faster. Each version of
+    the source is converted once into the temp directory.
+    
+    Args:
+        layer_name: Name of the layer (used for the converted file name)
+        layer_path: Path to the source GeoJSON
+        src_stat: Optional os.stat_result of the source
+        
+    Returns:
+        Path to the FlatGeobuf copy (the source itself if it is already
+        FlatGeobuf), or None if GDAL is unavailable or the conversion fails
+    """
+    if Path(layer_path).suffix == '.fgb':
+        return Path(layer_path)
+    
+    try:
+        from osgeo import gdal
+    except ImportError:
+        return None
+    
+    if src_stat is None:
+        return None
+    fgb_path = staged_copy_path(layer_name, layer_path, src_stat, '.fgb')
+    if fgb_path.exists():
+        logger.debug("Using previously converted FlatGeobuf: %s", fgb_path)
+        return fgb_path
+    
+    partial_path = fgb_path.with_suffix('.partial.fgb')
+    try:
+        src_ds = gdal.OpenEx(str(layer_path), gdal.OF_VECTOR, open_options=GEOJSON_OPEN_OPTIONS)
+        if src_ds is None:
+            raise RuntimeError(gdal.GetLastErrorMsg())
+        
+        logger.info("Converting %s to FlatGeobuf", layer_name)
+        out_ds = gdal.VectorTranslate(str(partial_path), src_ds, format='FlatGeobuf',
+                                      layerCreationOptions=['SPATIAL_INDEX=YES'])
+        if out_ds is None:
+            raise RuntimeError(gdal.GetLastErrorMsg())
+        out_ds = src_ds = None  # Flush and close before moving into place
+        os.replace(partial_path, fgb_path)
+        return fgb_path
+    except RuntimeError as e:
+        logger.warning("Could not convert %s to FlatGeobuf: %s", layer_name, e)
+        partial_path.unlink(missing_ok=True)
+        return None
+
+
+def layer_source_path(layer_config, config, layers_root=None):
+    """
+    Path of a layer's staged source file: GeoTIFF for rasters; for vectors
+    FlatGeobuf when one has been staged, else GeoJSON.
+    
+    Args:
+        layer_config: Layer configuration dict with 'name' and 'geometry_type'
+        config: Atlas configuration dict
+        layers_root: Optional atlas layers directory, if already resolved by the caller
+        
+    Returns:
+        Path to the layer file under the atlas layers directory
+    """
+    layer_name = layer_config['name']
+    if layers_root is None:
+        layers_root = versioning.atlas_path(config, "layers")
+    layer_dir = layers_root / layer_name
+    if layer_config.get('geometry_type', 'polygon') == 'raster':
+        return layer_dir / f"{layer_name}.tiff"
+    fgb_path = layer_dir / f"{layer_name}.fgb"
+    if fgb_path.exists():
+        return fgb_path
+    return layer_dir / f"{layer_name}.geojson"
+
+
+def _rendered_attributes(layer_config):
+    """Names of the feature attributes read when styling and labeling a layer."""
+    attributes = ['vector_width']
+    if layer_config.get('add_labels', False):
+        label_attr = layer_config.get('alterations', {}).get('label_attribute', 'name')
+        if label_attr not in attributes:
+            attributes.append(label_attr)
+    return attributes
+
+
+def load_full_layer(layer_config, config, layers_root=None):
     """
     Load a full layer (vector or raster) from staging area.
     
+    Loaded layers are kept for the life of the process and reused while the
+    source file is unchanged, so back-to-back outlets don't reload them.
+    
     Args:
         layer_config: Layer configuration dict with 'name' and 'geometry_type'
         config: Atlas configuration dict
+        layers_root: Optional atlas layers directory, if already resolved by the caller
         
     Returns:
         QgsVectorLayer or QgsRasterLayer, or None if loading fails
     """
     layer_name = layer_config['name']
     geometry_type = layer_config.get('geometry_type', 'polygon')
+    layer_path = layer_source_path(layer_config, config, layers_root)
+    
+    # Reuse the layer loaded earlier in this process if the source is unchanged
+    try:
+        src_stat = layer_path.stat()
+        cache_key = (layer_name, str(layer_path), src_stat.st_mtime_ns, src_stat.st_size,
+                     tuple(_rendered_attributes(layer_config)))
+    except OSError:
+        src_stat = cache_key = None
+    if cache_key in _layer_cache:
+        # Move to the end so the cache evicts least recently used layers
+        layer = _layer_cache[cache_key] = _layer_cache.pop(cache_key)
+        if isinstance(layer, QgsVectorLayer):
+            layer.setSubsetString("")
+            # Undo the last region's label flags, for callers that render the whole layer
+            if layer.id() in _label_keep_layers:
+                _flag_first_labels(layer)
+        logger.info("Reusing loaded layer: %s", layer_name)
+        return layer
     
-    # Determine layer format and path
     if geometry_type == 'raster':
-        layer_format = 'tiff'
-        layer_path = versioning.atlas_path(config, "layers") / layer_name / f"{layer_name}.{layer_format}"
-        
-        layer = QgsRasterLayer(str(layer_path), layer_name)
+        # Tiled COG so region renders only read the blocks they overlap
+        load_path = cog_raster_path(layer_name, layer_path, src_stat)
+        layer = QgsRasterLayer(str(load_path), layer_name)
         if not layer.isValid():
-            logger.warning(f"Failed to load raster layer: {layer_name} from {layer_path}")
+            logger.warning("Failed to load raster layer: %s from %s", layer_name, layer_path)
             return None
-        logger.info(f"Loaded raster layer: {layer_name}")
+        logger.info("Loaded raster layer: %s", layer_name)
+        _cache_layer(cache_key, layer)
         return layer
     else:
-        layer_format = 'geojson'
-        layer_path = versioning.atlas_path(config, "layers") / layer_name / f"{layer_name}.{layer_format}"
-        
-        # Create cleaned temporary GeoJSON (remove GRASS metadata that confuses GDAL)
-        temp_dir = Path(tempfile.gettempdir()) / "stewardship_atlas_qgis"
-        temp_dir.mkdir(exist_ok=True)
-        temp_path = temp_dir / f"{layer_name}_clean.geojson"
-        
-        if not clean_grass_geojson(layer_path, temp_path):
-            logger.warning(f"Failed to clean GeoJSON for {layer_name}, trying original")
-            load_path = layer_path
-        else:
-            load_path = temp_path
-            logger.debug(f"Using cleaned GeoJSON: {temp_path}")
-        
-        # Load the cleaned GeoJSON
         options = QgsVectorLayer.LayerOptions()
         options.loadDefaultStyle = False
         
-        logger.debug(f"Loading {layer_name} from: {load_path}")
-        layer = QgsVectorLayer(str(load_path), layer_name, "ogr", options)
+        # Cleaned copy of this exact version of the source, if one is needed
+        temp_path = staged_copy_path(layer_name, layer_path, src_stat, '_clean.geojson') if src_stat else None
+        
+        # Prefer the FlatGeobuf copy, which opens without re-parsing JSON
+        fgb_path = fgb_vector_path(layer_name, layer_path, src_stat)
+        layer = QgsVectorLayer(str(fgb_path), layer_name, "ogr", options) if fgb_path else None
+        
+        if layer is not None and layer.isValid():
+            logger.debug("Loading %s from: %s", layer_name, fgb_path)
+        elif temp_path is not None and temp_path.exists():
+            # Cleaned on an earlier run from this same source file
+            logger.debug("Using previously cleaned GeoJSON: %s", temp_path)
+            layer = QgsVectorLayer(str(temp_path), layer_name, "ogr", options)
+        else:
+            # Open the source in place; no need to rewrite it first
+            uri = str(layer_path) + "".join(f"|option:{o}" for o in GEOJSON_OPEN_OPTIONS)
+            logger.debug("Loading %s from: %s", layer_name, uri)
+            layer = QgsVectorLayer(uri, layer_name, "ogr", options)
             
+            if not layer.isValid():
+                # Fall back to a cleaned copy (remove GRASS metadata that confuses GDAL)
+                logger.warning("Failed to open %s directly, retrying with cleaned GeoJSON", layer_name)
+                if temp_path is not None and clean_grass_geojson(layer_path, temp_path):
+                    logger.debug("Using cleaned GeoJSON: %s", temp_path)
+                    layer = QgsVectorLayer(str(temp_path), layer_name, "ogr", options)
+        
         if not layer.isValid():
-            logger.warning(f"Failed to load vector layer: {layer_name}")
-            logger.warning(f"Layer error: {layer.error().message()}")
+            logger.warning("Failed to load vector layer: %s", layer_name)
+            logger.warning("Layer error: %s", layer.error().message())
             return None
         
         # Check if layer has a valid CRS
         if not layer.crs().isValid():
-            logger.warning(f"Layer {layer_name} has invalid CRS, setting to WGS84")
-            layer.setCrs(QgsCoordinateReferenceSystem("EPSG:4326"))
+            logger.warning("Layer %s has invalid CRS, setting to WGS84", layer_name)
+            layer.setCrs(_wgs84())
         
-        logger.info(f"Loaded vector layer: {layer_name} ({layer.featureCount()} features, CRS: {layer.crs().authid()})")
+        # Copy the features into RAM; the memory provider keeps geometries
+        # resident instead of going back through OGR for every region. Only
+        # the attributes the styling reads are copied along
+        fields = layer.fields()
+        attributes = [name for name in _rendered_attributes(layer_config) if fields.indexOf(name) >= 0]
+        memory_layer = layer.materialize(QgsFeatureRequest().setSubsetOfAttributes(attributes, fields))
+        if memory_layer is not None and memory_layer.isValid():
+            # materialize() names the copy "Materialized"; legend filtering
+            # and labels go by the layer name
+            memory_layer.setName(layer_name)
+            layer = memory_layer
+        else:
+            logger.warning("Could not copy %s into memory, using the file-backed layer", layer_name)
+        
+        # Index the features once so per-region bbox queries don't scan every feature
+        provider = layer.dataProvider()
+        if provider.capabilities() & QgsVectorDataProvider.CreateSpatialIndex:
+            provider.createSpatialIndex()
+        
+        # Point layers get a flat KD-tree, which answers bbox queries faster
+        # than the provider's R-tree (it only holds single-point geometries)
+        if QgsWkbTypes.flatType(layer.wkbType()) == QgsWkbTypes.Point:
+            _point_indexes[layer.id()] = QgsSpatialIndexKDBush(layer.getFeatures())
+        
+        # Regions are selected by flagging their features; testing one integer
+        # per feature while rendering is far cheaper than a '$id IN (...)' list
+        if layer.providerType() == 'memory' and provider.addAttributes([QgsField(REGION_FIELD, QVariant.Int)]):
+            layer.updateFields()
+            _region_fids[layer.id()] = set()
+        
+        # Deduplicated labels are flagged rather than selected with a group_by
+        # aggregate evaluated during labeling: here over the whole layer (as
+        # the atlas outlet renders it), then per region by apply_region_filter
+        if (layer_config.get('add_labels', False) and layer_config.get('deduplicate_labels', False)
+                and layer.providerType() == 'memory'):
+            label_attr = layer_config.get('alterations', {}).get('label_attribute', 'name')
+            if fields.indexOf(label_attr) >= 0 and provider.addAttributes([QgsField(LABEL_KEEP_FIELD, QVariant.Int)]):
+                layer.updateFields()
+                _label_keep_layers[layer.id()] = label_attr
+                _flag_first_labels(layer)
+        
+        logger.info("Loaded vector layer: %s (%s features, CRS: %s)", layer_name, layer.featureCount(), layer.crs().authid())
+        _cache_layer(cache_key, layer)
         return layer
 
 
-def apply_basic_styling(layer, layer_config, config=None, feature_scale=1.0):
+def _config_digest(layer_config):
+    """Short digest identifying a layer config's contents (key order ignored)."""
+    if orjson is not None:
+        data = orjson.dumps(layer_config, option=orjson.OPT_SORT_KEYS, default=str)
+    else:
+        data = json.dumps(layer_config, sort_keys=True, default=str).encode('utf-8')
+    return hashlib.blake2b(data, digest_size=16).digest()
+
+
+def _has_vector_width_field(layer):
+    """Whether a layer has a per-feature vector_width field (looked up once per layer)."""
+    has_field = _vector_width_fields.get(layer.id())
+    if has_field is None:
+        has_field = layer.fields().indexOf('vector_width') >= 0
+        _vector_width_fields[layer.id()] = has_field
+    return has_field
+
+
+def _default_symbol(geometry_type):
+    """Fresh copy of the default symbol for a geometry type."""
+    symbol = _default_symbols.get(geometry_type)
+    if symbol is None:
+        symbol = _default_symbols[geometry_type] = QgsSymbol.defaultSymbol(geometry_type)
+    return symbol.clone()
+
+
+def _font(family, size, bold=False):
+    """Shared QFont for a family (None for the default) and size; callers must not modify it."""
+    key = (family, size, bold)
+    font = _fonts.get(key)
+    if font is None:
+        font = _fonts[key] = QFont(family) if family else QFont()
+        font.setPointSize(size)
+        font.setBold(bold)
+    return font
+
+
+def _vector_width_property(feature_scale):
+    """Parsed '"vector_width" * feature_scale' stroke width property, one per scale."""
+    prop = _vector_width_props.get(feature_scale)
+    if prop is None:
+        prop = QgsProperty.fromExpression(f'"vector_width" * {feature_scale}')
+        _vector_width_props[feature_scale] = prop
+    return prop
+
+
+def _symbol_cache_key(layer, layer_config, config, feature_scale):
     """
-    Apply basic styling to a QGIS layer based on configuration.
+    Build a hashable key from everything _build_symbol reads.
+    
+    Layers that produce the same key get clones of one cached renderer instead
+    of building their own symbol.
+    """
+    color = layer_config.get('color', [100, 100, 100])
+    fill_color = layer_config.get('fill_color', color)
+    symbol_config = layer_config.get('symbol', {})
+    return (
+        layer_config.get('geometry_type', 'linestring'),
+        layer.geometryType(),
+        tuple(color),
+        tuple(fill_color) if fill_color != 'none' else None,
+        layer_config.get('constant_width', 2),
+        layer_config.get('fill_opacity', 0.5),
+        'vector_width' in layer_config,
+        _has_vector_width_field(layer),
+        symbol_config.get('png'),
+        layer_config.get('icon-size', 1.0),
+        str(versioning.atlas_path(config, "local")) if config else None,
+        feature_scale,
+    )
+
+
+def _build_symbol(layer, layer_config, config=None, feature_scale=1.0):
+    """
+    Create the feature symbol for a vector layer based on configuration.
     
     Args:
-        layer: QgsVectorLayer or QgsRasterLayer
-        layer_config: Layer configuration dict with color, width, labels, etc.
+        layer: QgsVectorLayer the symbol is built for
+        layer_config: Layer configuration dict with color, width, etc.
         config: Optional atlas configuration (needed for loading custom icon PNG files)
         feature_scale: Scale factor for feature sizes (default 1.0)
+        
+    Returns:
+        QgsSymbol for the layer's geometry type
     """
-    if isinstance(layer, QgsRasterLayer):
-        # Raster styling - just set opacity if configured
-        opacity = layer_config.get('opacity', 1.0)
-        layer.setOpacity(opacity)
-        return
-    
-    # Vector styling
     geometry_type = layer_config.get('geometry_type', 'linestring')
     color = layer_config.get('color', [100, 100, 100])
     fill_color = layer_config.get('fill_color', color)
     
     # Create QColor objects
     qcolor = QColor(color[0], color[1], color[2])
-    qfill_color = QColor(fill_color[0], fill_color[1], fill_color[2]) if fill_color != 'none' else None
     
     # Create symbol based on geometry type
     if geometry_type == 'point':
@@ -331,7 +1036,7 @@ def apply_basic_styling(layer, layer_config, config=None, feature_scale=1.0):
                 
                 if icon_path.exists():
                     # Create symbol with raster marker
-                    symbol = QgsSymbol.defaultSymbol(layer.geometryType())
+                    symbol = _default_symbol(layer.geometryType())
                     
                     # Create raster marker layer
                     raster_marker = QgsRasterMarkerSymbolLayer(str(icon_path))
@@ -347,37 +1052,36 @@ def apply_basic_styling(layer, layer_config, config=None, feature_scale=1.0):
                     symbol.deleteSymbolLayer(0)
                     symbol.appendSymbolLayer(raster_marker)
                     
-                    logger.info(f"✓ Applied custom PNG icon: {png_icon} for {layer.name()}")
+                    logger.info("✓ Applied custom PNG icon: %s for %s", png_icon, layer.name())
                 else:
-                    logger.warning(f"PNG icon not found: {icon_path}, using default circle")
-                    symbol = QgsSymbol.defaultSymbol(layer.geometryType())
+                    logger.warning("PNG icon not found: %s, using default circle", icon_path)
+                    symbol = _default_symbol(layer.geometryType())
                     symbol.setColor(qcolor)
                     symbol.setSize(3 * feature_scale)
             except Exception as e:
-                logger.warning(f"Failed to load PNG icon {png_icon}: {e}, using default circle")
-                symbol = QgsSymbol.defaultSymbol(layer.geometryType())
+                logger.warning("Failed to load PNG icon %s: %s, using default circle", png_icon, e)
+                symbol = _default_symbol(layer.geometryType())
                 symbol.setColor(qcolor)
                 symbol.setSize(3 * feature_scale)
         else:
             # No custom icon, use default
-            symbol = QgsSymbol.defaultSymbol(layer.geometryType())
+            symbol = _default_symbol(layer.geometryType())
             symbol.setColor(qcolor)
             symbol.setSize(3 * feature_scale)  # Basic point size scaled by feature_scale
         
     elif geometry_type == 'linestring':
-        symbol = QgsSymbol.defaultSymbol(layer.geometryType())
+        symbol = _default_symbol(layer.geometryType())
         symbol.setColor(qcolor)
         
         # Check if width should come from per-feature attribute
         # If 'vector_width' key exists in config (any value), use feature's vector_width attribute
         if 'vector_width' in layer_config:
             # Check if the layer actually has a vector_width field
-            fields = layer.fields()
-            if fields.indexOf('vector_width') >= 0:
+            if _has_vector_width_field(layer):
                 # Use data-defined width from each feature's vector_width attribute
                 width = layer_config.get('constant_width', 2)
                 symbol.setWidth(width * feature_scale)  # Default/fallback width scaled by feature_scale
-                logger.info(f"set constant width: {width} * {feature_scale}")
+                logger.info("set constant width: %s * %s", width, feature_scale)
                 
                 # Set data-defined property to read from feature attribute
                 symbol_layer = symbol.symbolLayer(0)
@@ -388,16 +1092,16 @@ def apply_basic_styling(layer, layer_config, config=None, feature_scale=1.0):
                         #symbol_layer.setWidthUnit(QgsUnitTypes.RenderMillimeters)
                         symbol_layer.setWidthUnit(QgsUnitTypes.RenderMapUnits)
                         
-                    logger.info(f"Using per-feature vector_width attribute (scale: {feature_scale}) for {layer.name()}")
+                    logger.info("Using per-feature vector_width attribute (scale: %s) for %s", feature_scale, layer.name())
                     # Width from 'vector_width' attribute in feature properties, scaled to mm
                     symbol_layer.setDataDefinedProperty(
                         QgsSymbolLayer.PropertyStrokeWidth,
-                        QgsProperty.fromExpression(f'"vector_width" * {feature_scale}')
+                        _vector_width_property(feature_scale)
                         #QgsProperty.fromExpression('"vector_width"')
                     )
 
             else:
-                logger.warning(f"Layer {layer.name()} config has 'vector_width' but features don't have that attribute")
+                logger.warning("Layer %s config has 'vector_width' but features don't have that attribute", layer.name())
                 # Fall back to constant width
                 width = layer_config.get('constant_width', 2)
                 symbol.setWidth(width * 0.1 * feature_scale)
@@ -405,164 +1109,217 @@ def apply_basic_styling(layer, layer_config, config=None, feature_scale=1.0):
             # Use constant width from config
             width = layer_config.get('constant_width', 2)
             symbol.setWidth(width * 0.1 * feature_scale)  # Scale to mm with feature_scale
-            logger.info(f"DEFAULT constant width: {width} * {feature_scale}")
+            logger.info("DEFAULT constant width: %s * %s", width, feature_scale)
     elif geometry_type == 'polygon':
-        symbol = QgsSymbol.defaultSymbol(layer.geometryType())
-        symbol.setColor(qcolor)
-        if qfill_color:
-            # Set fill opacity
-            fill_opacity = layer_config.get('fill_opacity', 0.5)
-            qfill_color.setAlphaF(fill_opacity)
+        if fill_color != 'none':
+            # Fill color with the configured opacity as its alpha
+            fill_alpha = round(255 * layer_config.get('fill_opacity', 0.5))
+            qfill_color = QColor(fill_color[0], fill_color[1], fill_color[2], fill_alpha)
         else:
             # No fill
             qfill_color = QColor(0, 0, 0, 0)
         
-        # Get the symbol layer and set fill color
-        symbol_layer = symbol.symbolLayer(0)
-        if isinstance(symbol_layer, QgsSimpleFillSymbolLayer):
-            symbol_layer.setFillColor(qfill_color)
-            symbol_layer.setStrokeColor(qcolor)
-            symbol_layer.setStrokeWidth(0.3 * feature_scale)  # Stroke width scaled by feature_scale
+        # Build the simple fill directly rather than restyling the default symbol
+        fill_layer = QgsSimpleFillSymbolLayer(
+            qfill_color,
+            strokeColor=qcolor,
+            strokeWidth=0.3 * feature_scale  # Stroke width scaled by feature_scale
+        )
+        symbol = QgsFillSymbol([fill_layer])
     
-    # Apply symbol renderer
-    renderer = QgsSingleSymbolRenderer(symbol)
-    layer.setRenderer(renderer)
+    return symbol
+
+
+def _build_labeling(layer, layer_config, label_attr):
+    """
+    Create the label settings for a vector layer based on configuration.
     
-    # Add labels if configured
-    if layer_config.get('add_labels', False):
-        label_attr = layer_config.get('alterations', {}).get('label_attribute', 'name')
+    Args:
+        layer: QgsVectorLayer the labels are built for (used for log messages)
+        layer_config: Layer configuration dict with label options
+        label_attr: Name of the attribute to label features with
         
-        # Check if attribute exists
-        fields = layer.fields()
-        if fields.indexOf(label_attr) >= 0:
-            pal_settings = QgsPalLayerSettings()
-            pal_settings.fieldName = label_attr
-            pal_settings.enabled = True
-            
-            # Label-label collision avoidance (can be disabled per-layer with 'avoid_label_collisions': false)
-            avoid_label_collisions = layer_config.get('avoid_label_collisions', True)
-            pal_settings.displayAll = not avoid_label_collisions  # displayAll=True means show all (no collision avoidance)
-            logger.debug(f"Label-label collision avoidance: {avoid_label_collisions}")
-            
-            # Label-feature collision avoidance (can be enabled per-layer with 'labels_avoid_features': true)
-            labels_avoid_features = layer_config.get('labels_avoid_features', False)
-            pal_settings.obstacleSettings().setIsObstacle(labels_avoid_features)
-            logger.debug(f"Label-feature collision avoidance: {labels_avoid_features}")
-            
-            # Limit number of labels (useful for dense point layers like milemarkers)
-            # Can be set per-layer with 'max_labels': <number>
-            max_labels = layer_config.get('max_labels', None)
-            if max_labels is not None:
-                pal_settings.limitNumLabels = True
-                pal_settings.maxNumLabels = int(max_labels)
-                logger.info(f"Limited {layer.name()} to maximum {max_labels} labels")
-            
-            # Text format - MUST be set before placement settings
-            text_format = QgsTextFormat()
-            
-            # For linestrings, use larger white labels; otherwise use layer color
-            if geometry_type == 'linestring':
-                text_format.setSize(14)  # Larger size for linestrings
-                text_format.setColor(QColor(255, 255, 255))  # White labels for linestrings
-                font = QFont()
-                font.setPointSize(14)
-                font.setBold(True)  # Make labels bold for better visibility
-            else:
-                text_format.setSize(10)
-                text_format.setColor(qcolor)
-                font = QFont()
-                font.setPointSize(10)
-            
-            text_format.setFont(font)
-            
-            # Add white background box if configured (useful for notes/annotations)
-            if layer_config.get('label_background', False):
-                background = QgsTextBackgroundSettings()
-                background.setEnabled(True)
-                background.setType(QgsTextBackgroundSettings.ShapeRectangle)
-                background.setFillColor(QColor(255, 255, 255))  # White fill
-                background.setStrokeColor(QColor(0, 0, 0))  # Black border
-                background.setStrokeWidth(0.3)
-                background.setSizeType(QgsTextBackgroundSettings.SizeBuffer)
-                background.setSize(QSizeF(1.0, 0.5))  # Buffer around text in mm
-                text_format.setBackground(background)
-                logger.info(f"Added white background box to labels for {layer.name()}")
-            
-            pal_settings.setFormat(text_format)
-            
-            # For linestrings, configure label placement
-            if geometry_type == 'linestring':
-                # Use Line placement for linestrings
-                pal_settings.placement = QgsPalLayerSettings.Line
-                
-                # Optional rotation: can be enabled per-layer with 'rotate_labels': true
-                if layer_config.get('rotate_labels', False):
-                    # Rotate labels to follow line direction - use OnLine flag ONLY
-                    # (MapOrientation actually PREVENTS rotation, keeping labels horizontal)
-                    flags = QgsLabeling.LinePlacementFlags()
-                    flags |= QgsLabeling.LinePlacementFlag.OnLine
-                    pal_settings.lineSettings().setPlacementFlags(flags)
-                    logger.info(f"Configured line placement with rotation for {layer.name()}")
-                else:
-                    # Keep labels horizontal - use MapOrientation flag
-                    # MapOrientation = keep labels aligned with map coordinates (horizontal)
-                    flags = QgsLabeling.LinePlacementFlags()
-                    flags |= QgsLabeling.LinePlacementFlag.OnLine
-                    flags |= QgsLabeling.LinePlacementFlag.MapOrientation
-                    pal_settings.lineSettings().setPlacementFlags(flags)
-                    logger.info(f"Configured line placement (horizontal) for {layer.name()}")
-                
-                # Optional: Repeat labels along long lines (off by default)
-                repeat_distance = layer_config.get('label_repeat_distance', 0)
-                if repeat_distance > 0:
-                    pal_settings.repeatDistance = repeat_distance
-                    pal_settings.repeatDistanceUnit = QgsUnitTypes.RenderMapUnits
-                    logger.debug(f"Label repeat enabled: {repeat_distance} map units")
-                
-                # Use negative distance to place below line, which centers better
-                # A small negative value shifts the label's baseline down
-                pal_settings.dist = -5  # Negative to shift down for vertical centering
-                pal_settings.distUnits = QgsUnitTypes.RenderPoints
-            
-            # Build Show expression (controls which labels are displayed)
-            # Start with base expression: label attribute is not NULL/empty
-            show_expr_parts = [f'"{label_attr}" IS NOT NULL AND "{label_attr}" != \'\'']
-            
-            # Add spatial filtering if max_labels is set (ensures even distribution)
-            if max_labels is not None:
-                # Use feature ID-based sampling instead of spatial grid
-                # This is simpler and works regardless of coordinate system
-                # Spreads selection by using modulo of feature ID
-                # Adjust the modulo divisor to control sampling rate
-                # For ~20% sampling: show where ($id % 5) = 0
-                # For ~10% sampling: show where ($id % 10) = 0
-                sampling_rate = 5  # Show every 5th feature (~20%)
-                show_expr_parts.append(f'($id % {sampling_rate} = 0)')
-                logger.info(f"Applied ID-based sampling (1 in {sampling_rate}) to {layer.name()} for distribution")
-            
-            # Add deduplication if enabled
-            if layer_config.get('deduplicate_labels', False):
-                # Only show first occurrence of each unique label value
-                show_expr_parts.append(f'($id = minimum($id, group_by:="{label_attr}"))')
-                logger.info(f"Enabled label deduplication for {layer.name()} on attribute: {label_attr}")
-            else:
-                logger.info(f"Label deduplication disabled for {layer.name()}, showing all non-empty labels")
-            
-            # Combine all conditions with AND
-            show_expr = ' AND '.join(show_expr_parts)
-            pal_settings.dataDefinedProperties().setProperty(
-                QgsPalLayerSettings.Show,
-                QgsProperty.fromExpression(show_expr)
-            )
+    Returns:
+        QgsVectorLayerSimpleLabeling
+    """
+    geometry_type = layer_config.get('geometry_type', 'linestring')
+    color = layer_config.get('color', [100, 100, 100])
+    qcolor = QColor(color[0], color[1], color[2])
+    
+    pal_settings = QgsPalLayerSettings()
+    pal_settings.fieldName = label_attr
+    pal_settings.enabled = True
+    
+    # Label-label collision avoidance (can be disabled per-layer with 'avoid_label_collisions': false)
+    avoid_label_collisions = layer_config.get('avoid_label_collisions', True)
+    pal_settings.displayAll = not avoid_label_collisions  # displayAll=True means show all (no collision avoidance)
+    logger.debug("Label-label collision avoidance: %s", avoid_label_collisions)
+    
+    # Label-feature collision avoidance (can be enabled per-layer with 'labels_avoid_features': true)
+    labels_avoid_features = layer_config.get('labels_avoid_features', False)
+    pal_settings.obstacleSettings().setIsObstacle(labels_avoid_features)
+    logger.debug("Label-feature collision avoidance: %s", labels_avoid_features)
+    
+    # Limit number of labels (useful for dense point layers like milemarkers)
+    # Can be set per-layer with 'max_labels': <number>
+    max_labels = layer_config.get('max_labels', None)
+    if max_labels is not None:
+        pal_settings.limitNumLabels = True
+        pal_settings.maxNumLabels = int(max_labels)
+        logger.info("Limited %s to maximum %s labels", layer.name(), max_labels)
+    
+    # Text format - MUST be set before placement settings
+    text_format = QgsTextFormat()
+    
+    # For linestrings, use larger white labels; otherwise use layer color
+    if geometry_type == 'linestring':
+        text_format.setSize(14)  # Larger size for linestrings
+        text_format.setColor(QColor(255, 255, 255))  # White labels for linestrings
+        font = _font(None, 14, bold=True)  # Make labels bold for better visibility
+    else:
+        text_format.setSize(10)
+        text_format.setColor(qcolor)
+        font = _font(None, 10)
+    
+    text_format.setFont(font)
+    
+    # Add white background box if configured (useful for notes/annotations)
+    if layer_config.get('label_background', False):
+        background = QgsTextBackgroundSettings()
+        background.setEnabled(True)
+        background.setType(QgsTextBackgroundSettings.ShapeRectangle)
+        background.setFillColor(QColor(255, 255, 255))  # White fill
+        background.setStrokeColor(QColor(0, 0, 0))  # Black border
+        background.setStrokeWidth(0.3)
+        background.setSizeType(QgsTextBackgroundSettings.SizeBuffer)
+        background.setSize(QSizeF(1.0, 0.5))  # Buffer around text in mm
+        text_format.setBackground(background)
+        logger.info("Added white background box to labels for %s", layer.name())
+    
+    pal_settings.setFormat(text_format)
+    
+    # For linestrings, configure label placement
+    if geometry_type == 'linestring':
+        # Use Line placement for linestrings
+        pal_settings.placement = QgsPalLayerSettings.Line
+        
+        # Optional rotation: can be enabled per-layer with 'rotate_labels': true
+        if layer_config.get('rotate_labels', False):
+            # Rotate labels to follow line direction - use OnLine flag ONLY
+            # (MapOrientation actually PREVENTS rotation, keeping labels horizontal)
+            flags = QgsLabeling.LinePlacementFlags()
+            flags |= QgsLabeling.LinePlacementFlag.OnLine
+            pal_settings.lineSettings().setPlacementFlags(flags)
+            logger.info("Configured line placement with rotation for %s", layer.name())
+        else:
+            # Keep labels horizontal - use MapOrientation flag
+            # MapOrientation = keep labels aligned with map coordinates (horizontal)
+            flags = QgsLabeling.LinePlacementFlags()
+            flags |= QgsLabeling.LinePlacementFlag.OnLine
+            flags |= QgsLabeling.LinePlacementFlag.MapOrientation
+            pal_settings.lineSettings().setPlacementFlags(flags)
+            logger.info("Configured line placement (horizontal) for %s", layer.name())
+        
+        # Optional: Repeat labels along long lines (off by default)
+        repeat_distance = layer_config.get('label_repeat_distance', 0)
+        if repeat_distance > 0:
+            pal_settings.repeatDistance = repeat_distance
+            pal_settings.repeatDistanceUnit = QgsUnitTypes.RenderMapUnits
+            logger.debug("Label repeat enabled: %s map units", repeat_distance)
+        
+        # Use negative distance to place below line, which centers better
+        # A small negative value shifts the label's baseline down
+        pal_settings.dist = -5  # Negative to shift down for vertical centering
+        pal_settings.distUnits = QgsUnitTypes.RenderPoints
+    
+    # Build Show expression (controls which labels are displayed)
+    # Start with base expression: label attribute is not NULL/empty
+    show_expr_parts = [f'"{label_attr}" IS NOT NULL AND "{label_attr}" != \'\'']
+    
+    # Add spatial filtering if max_labels is set (ensures even distribution)
+    if max_labels is not None:
+        # Use feature ID-based sampling instead of spatial grid
+        # This is simpler and works regardless of coordinate system
+        # Spreads selection by using modulo of feature ID
+        # Adjust the modulo divisor to control sampling rate
+        # For ~20% sampling: show where ($id % 5) = 0
+        # For ~10% sampling: show where ($id % 10) = 0
+        sampling_rate = 5  # Show every 5th feature (~20%)
+        show_expr_parts.append(f'($id % {sampling_rate} = 0)')
+        logger.info("Applied ID-based sampling (1 in %s) to %s for distribution", sampling_rate, layer.name())
+    
+    # Add deduplication if enabled
+    if layer_config.get('deduplicate_labels', False):
+        # Only show first occurrence of each unique label value
+        if layer.id() in _label_keep_layers:
+            show_expr_parts.append(f'"{LABEL_KEEP_FIELD}" = 1')
+        else:
+            show_expr_parts.append(f'($id = minimum($id, group_by:="{label_attr}"))')
+        logger.info("Enabled label deduplication for %s on attribute: %s", layer.name(), label_attr)
+    else:
+        logger.info("Label deduplication disabled for %s, showing all non-empty labels", layer.name())
+    
+    # Combine all conditions with AND
+    show_expr = ' AND '.join(show_expr_parts)
+    pal_settings.dataDefinedProperties().setProperty(
+        QgsPalLayerSettings.Show,
+        QgsProperty.fromExpression(show_expr)
+    )
+    
+    return QgsVectorLayerSimpleLabeling(pal_settings)
+
 
+def apply_basic_styling(layer, layer_config, config=None, feature_scale=1.0):
+    """
+    Apply basic styling to a QGIS layer based on configuration.
+    
+    Args:
+        layer: QgsVectorLayer or QgsRasterLayer
+        layer_config: Layer configuration dict with color, width, labels, etc.
+        config: Optional atlas configuration (needed for loading custom icon PNG files)
+        feature_scale: Scale factor for feature sizes (default 1.0)
+    """
+    if isinstance(layer, QgsRasterLayer):
+        # Raster styling - just set opacity if configured
+        opacity = layer_config.get('opacity', 1.0)
+        layer.setOpacity(opacity)
+        return
+    
+    # Vector styling
+    # Apply symbol renderer (shared by all layers with the same styling)
+    cache_key = _symbol_cache_key(layer, layer_config, config, feature_scale)
+    renderer = _renderer_cache.get(cache_key)
+    if renderer is None:
+        symbol = _build_symbol(layer, layer_config, config, feature_scale)
+        renderer = QgsSingleSymbolRenderer(symbol)
+        _renderer_cache[cache_key] = renderer
+    layer.setRenderer(renderer.clone())
+    
+    # Layers without labels stay out of the labeling engine entirely (no
+    # label provider, so their features aren't gathered as obstacles either)
+    layer.setLabeling(None)
+    layer.setLabelsEnabled(False)
+    
+    # Add labels if configured
+    if layer_config.get('add_labels', False):
+        label_attr = layer_config.get('alterations', {}).get('label_attribute', 'name')
+        
+        # Check if attribute exists
+        fields = layer.fields()
+        if fields.indexOf(label_attr) >= 0:
+            # Build the labeling once per distinct layer config
+            config_key = (_config_digest(layer_config), label_attr, layer.id() in _label_keep_layers)
+            labeling = _labeling_cache.get(config_key)
+            if labeling is None:
+                labeling = _build_labeling(layer, layer_config, label_attr)
+                _labeling_cache[config_key] = labeling
             
             # Apply labeling
-            labeling = QgsVectorLayerSimpleLabeling(pal_settings)
-            layer.setLabeling(labeling)
+            layer.setLabeling(labeling.clone())
             layer.setLabelsEnabled(True)
-            logger.info(f"Added labels to {layer.name()} using attribute: {label_attr}")
+            logger.info("Added labels to %s using attribute: %s", layer.name(), label_attr)
         else:
-            logger.warning(f"Label attribute '{label_attr}' not found in layer {layer.name()}")
+            logger.warning("Label attribute '%s' not found in layer %s", label_attr, layer.name())
     
     layer.triggerRepaint()
 
@@ -581,36 +1338,83 @@ def collect_layer_attributions(config, outlet_config):
     attributions = set()
     in_layers = outlet_config.get('in_layers', [])
     
-    # For each layer, find its source asset and get attribution
+    # Index the assets by the layer they output to, in one pass
+    assets_by_layer = {}
+    for asset_config in config.get('assets', {}).values():
+        assets_by_layer.setdefault(asset_config.get('out_layer'), []).append(asset_config)
+    
+    # For each layer, find its source assets and get attribution
     for layer_name in in_layers:
-        # Find assets that output to this layer
-        for asset_name, asset_config in config.get('assets', {}).items():
-            if asset_config.get('out_layer') == layer_name:
-                # Get the inlet config definition
-                config_def = asset_config.get('config_def')
-                if config_def:
-                    # Look up in inlets config
-                    inlet_config = config.get('inlets', {}).get(config_def, {})
-                    attribution = inlet_config.get('attribution', {})
-                    description = attribution.get('description', '')
-                    if description:
-                        attributions.add(description)
+        for asset_config in assets_by_layer.get(layer_name, []):
+            # Get the inlet config definition
+            config_def = asset_config.get('config_def')
+            if config_def:
+                # Look up in inlets config
+                inlet_config = config.get('inlets', {}).get(config_def, {})
+                attribution = inlet_config.get('attribution', {})
+                description = attribution.get('description', '')
+                if description:
+                    attributions.add(description)
+    
+    return sorted(attributions)
+
+
+def project_layer_crs(project):
+    """
+    CRS region maps are laid out in: that of the first layer in the project.
     
-    return sorted(list(attributions))
+    Args:
+        project: QgsProject instance
+        
+    Returns:
+        QgsCoordinateReferenceSystem (WGS84 if the project has no layers)
+    """
+    for layer in project.mapLayers().values():
+        if hasattr(layer, 'crs'):
+            return layer.crs()
+    return _wgs84()
 
 
-def create_region_layout(region, project, config, outlet_name):
+def _add_collar_text(layout, heading, body, x, y, size):
     """
-    Create a print layout for a region.
+    Add a bold heading with a plain body below it to a layout's collar.
+    
+    Args:
+        layout: QgsPrintLayout
+        heading: Heading text, drawn in bold
+        body: Body text, may span several lines
+        x: Left edge in mm
+        y: Top edge of the heading in mm
+        size: Font size in points
+    """
+    for text, bold in ((heading, True), (body, False)):
+        label = QgsLayoutItemLabel(layout)
+        label.setText(text)
+        label.setFont(_font("Arial", size, bold=bold))
+        label.setMode(QgsLayoutItemLabel.ModeText)
+        label.attemptMove(QgsLayoutPoint(x, y, QgsUnitTypes.LayoutMillimeters))
+        label.adjustSizeToText()
+        label.setFrameEnabled(False)
+        layout.addLayoutItem(label)
+        y += label.sizeWithUnits().height()
+
+
+def _build_layout_template(project, config, outlet_name, layer_crs=None):
+    """
+    Build the parts of a region layout that are the same for every region.
+    
+    Page, map frame, collar, legend, scale bars and labels only depend on the
+    outlet config and the loaded layers, so they are built once and reused;
+    _set_layout_region() then fills in each region's extent.
     
     Args:
-        region: Region dict with bbox, name, caption
         project: QgsProject instance
         config: Atlas configuration dict
         outlet_name: Name of the outlet
+        layer_crs: CRS of the loaded layers (default: project_layer_crs())
         
     Returns:
-        QgsPrintLayout configured for the region
+        Dict with the layout, its map item and the CRS transforms for region bboxes
     """
     outlet_config = config['assets'][outlet_name]
     
@@ -621,49 +1425,28 @@ def create_region_layout(region, project, config, outlet_name):
     # Create layout
     layout = QgsPrintLayout(project)
     layout.initializeDefaults()
-    layout.setName(f"Region_{region['name']}")
     
     # Set page size
     page_collection = layout.pageCollection()
     page = page_collection.page(0)
     
-    if page_size == 'A4':
-        if page_orientation == 'Landscape':
-            page.setPageSize('A4', QgsLayoutItemPage.Landscape)
-        else:
-            page.setPageSize('A4')
-    elif page_size == 'Letter':
-        if page_orientation == 'Landscape':
-            page.setPageSize('Letter', QgsLayoutItemPage.Landscape)
-        else:
-            page.setPageSize('Letter')
+    # Anything other than 'Landscape' has always meant portrait
+    orientation = 'Landscape' if page_orientation == 'Landscape' else 'Portrait'
+    page_spec = _PAGE_SPEC.get((page_size, orientation))
+    if page_spec is not None:
+        page_name, page_orientation_name = page_spec
+        page.setPageSize(page_name, getattr(QgsLayoutItemPage, page_orientation_name))
     
     # Check if map collar is enabled (default True)
     enable_collar = outlet_config.get('map_collar', True)
     collar_height = 25  # mm
     
-    # Get page dimensions
-    if page_size == 'A4':
-        if page_orientation == 'Landscape':
-            page_width = 297  # mm
-            page_height = 210  # mm
-        else:
-            page_width = 210  # mm
-            page_height = 297  # mm
-    elif page_size == 'Letter':
-        if page_orientation == 'Landscape':
-            page_width = 279.4  # mm (11 inches)
-            page_height = 215.9  # mm (8.5 inches)
-        else:
-            page_width = 215.9  # mm
-            page_height = 279.4  # mm
-    else:
-        # Default to A4 portrait
-        page_width = 210  # mm
-        page_height = 297  # mm
+    # Get page dimensions (mm)
+    page_width, page_height = _PAGE_DIMS.get((page_size, orientation), (210, 297))
     
     # Add map item
     map_item = QgsLayoutItemMap(layout)
+    map_item.setId("main_map")
     
     # Position and size (adjust for collar if enabled)
     margin = 2  # mm - small margin to avoid cutting off content at edges
@@ -678,105 +1461,42 @@ def create_region_layout(region, project, config, outlet_name):
     # Set to NOT keep scale - allows map to fill the frame
     map_item.setKeepLayerSet(True)  # Keep the same layers visible
     
-    # Set extent to region bbox
-    bbox = region['bbox']
-    
-    # Get layer CRS (assume first layer in project)
-    layer_crs = None
-    layers = project.mapLayers().values()
-    for layer in layers:
-        if hasattr(layer, 'crs'):
-            layer_crs = layer.crs()
-            break
-    
     if layer_crs is None:
-        # Default to WGS84
-        layer_crs = QgsCoordinateReferenceSystem("EPSG:4326")
+        layer_crs = project_layer_crs(project)
     
-    # Create rectangle in WGS84 (bbox is in lat/long)
-    bbox_rect = QgsRectangle(
-        bbox['west'], bbox['south'],
-        bbox['east'], bbox['north']
-    )
-    
-    # Transform if needed
-    wgs84 = QgsCoordinateReferenceSystem("EPSG:4326")
-    if layer_crs != wgs84:
-        transform = QgsCoordinateTransform(wgs84, layer_crs, project)
-        bbox_rect = transform.transformBoundingBox(bbox_rect)
+    # Transform from WGS84 if needed (region bboxes are in lat/long)
+    to_layer_crs = _bbox_transform(layer_crs) if layer_crs != _wgs84() else None
     
     # Determine the best CRS for rendering (needed for accurate scale bars)
     # If layer_crs is geographic (degrees), we need to use a projected CRS
     render_crs = layer_crs
+    to_render_crs = None
     if layer_crs.isGeographic():
         # Use Web Mercator for rendering - it's a good general-purpose projected CRS
-        render_crs = QgsCoordinateReferenceSystem("EPSG:3857")
-        logger.info(f"Layer CRS {layer_crs.authid()} is geographic, using EPSG:3857 for rendering")
-        # Transform bbox to the rendering CRS
-        transform = QgsCoordinateTransform(layer_crs, render_crs, project)
-        bbox_rect = transform.transformBoundingBox(bbox_rect)
-    
-    # Keep original bbox for clipping (in render_crs)
-    original_bbox_rect = QgsRectangle(bbox_rect)
-    
-    # Calculate map frame aspect ratio
-    frame_aspect = map_width / map_height
-    
-    # Calculate bbox aspect ratio
-    bbox_width = bbox_rect.width()
-    bbox_height = bbox_rect.height()
-    bbox_aspect = bbox_width / bbox_height
-    
-    # Adjust bbox to match frame aspect ratio (expand to fill frame)
-    if bbox_aspect < frame_aspect:
-        # Bbox is too tall, expand width
-        new_width = bbox_height * frame_aspect
-        width_diff = new_width - bbox_width
-        bbox_rect.setXMinimum(bbox_rect.xMinimum() - width_diff / 2)
-        bbox_rect.setXMaximum(bbox_rect.xMaximum() + width_diff / 2)
-    else:
-        # Bbox is too wide, expand height
-        new_height = bbox_width / frame_aspect
-        height_diff = new_height - bbox_height
-        bbox_rect.setYMinimum(bbox_rect.yMinimum() - height_diff / 2)
-        bbox_rect.setYMaximum(bbox_rect.yMaximum() + height_diff / 2)
+        render_crs = _crs("EPSG:3857")
+        logger.info("Layer CRS %s is geographic, using EPSG:3857 for rendering", layer_crs.authid())
+        to_render_crs = _crs_transform(layer_crs, render_crs)
     
-    map_item.setExtent(bbox_rect)
     map_item.setCrs(render_crs)
     
-    # Apply layout-specific clipping to the original bbox region
-    # This clips features at render time for the layout only
-    clip_points = [
-        QgsPointXY(original_bbox_rect.xMinimum(), original_bbox_rect.yMinimum()),
-        QgsPointXY(original_bbox_rect.xMaximum(), original_bbox_rect.yMinimum()),
-        QgsPointXY(original_bbox_rect.xMaximum(), original_bbox_rect.yMaximum()),
-        QgsPointXY(original_bbox_rect.xMinimum(), original_bbox_rect.yMaximum())
-    ]
-    clip_geometry = QgsGeometry.fromPolygonXY([clip_points])
-    
-    # Try to use atlas clipping settings for map content clipping (QGIS 3.16+)
-    try:
-        from qgis.core import QgsMapClippingRegion
-        
-        # Create clipping region for map rendering
-        clipping_region = QgsMapClippingRegion(clip_geometry)
-        clipping_region.setFeatureClip(QgsMapClippingRegion.FeatureClippingType.ClipToIntersection)
-        
-        # Use atlas clipping settings (which handles map content clipping)
-        atlas_settings = map_item.atlasClippingSettings()
-        atlas_settings.setEnabled(True)
-        atlas_settings.setFeatureClippingType(QgsMapClippingRegion.FeatureClippingType.ClipToIntersection)
-        atlas_settings.setClipGeometry(clip_geometry)
-        map_item.setAtlasClippingSettings(atlas_settings)
-        
-        logger.info(f"Applied atlas clipping for map content bbox: {original_bbox_rect}")
-        
-    except (ImportError, AttributeError, TypeError) as e:
-        logger.warning(f"Layout clipping not available: {e}")
-        logger.warning("Features may extend beyond region boundary")
-    
     layout.addLayoutItem(map_item)
     
+    # Invisible rectangle the map is clipped to; _set_layout_region() moves it
+    # over each region's bbox, so features crossing the region edge are not
+    # drawn into the padding that fits the bbox to the frame's aspect ratio
+    clip_shape = QgsLayoutItemShape(layout)
+    clip_shape.setShapeType(QgsLayoutItemShape.Rectangle)
+    clip_shape.setSymbol(QgsFillSymbol.createSimple({'color': '0,0,0,0', 'outline_style': 'no'}))
+    layout.addLayoutItem(clip_shape)
+    
+    # Clip on the painter only, as the atlas outlet does: features are
+    # already filtered to the region, so there is no geometry to intersect
+    clipping = map_item.itemClippingSettings()
+    clipping.setEnabled(True)
+    clipping.setSourceItem(clip_shape)
+    clipping.setFeatureClippingType(QgsMapClippingRegion.FeatureClippingType.ClipPainterOnly)
+    clipping.setForceLabelsInsideClipPath(True)
+    
     if enable_collar:
         # Calculate collar position (flush at bottom of page)
         collar_y = page_height - collar_height - margin
@@ -855,7 +1575,7 @@ def create_region_layout(region, project, config, outlet_name):
         # North Indicator (simple text)
         north_label = QgsLayoutItemLabel(layout)
         north_label.setText("↑ N")  # Up arrow + N
-        north_font = QFont("Arial", 10, QFont.Bold)
+        north_font = _font("Arial", 10, bold=True)
         north_label.setFont(north_font)
         north_label.setHAlign(1)  # Center align
         north_label.attemptMove(QgsLayoutPoint(scale_x, collar_content_y, QgsUnitTypes.LayoutMillimeters))
@@ -878,7 +1598,7 @@ def create_region_layout(region, project, config, outlet_name):
         scale_bar.setStyle('Double Box')
         
         # Make text smaller to prevent overlap
-        scale_font = QFont("Arial", 6)
+        scale_font = _font("Arial", 6)
         scale_bar.setFont(scale_font)
         scale_bar.setUnitLabel('ft')  # Show "ft" label
         
@@ -907,42 +1627,22 @@ def create_region_layout(region, project, config, outlet_name):
         # RIGHT SECTION (40%): CRS and Attribution
         info_x = margin + (map_width * 0.60) + 5
         
+        # Plain-text labels (a bold heading over a regular body) instead of
+        # HTML ones, so exporting a page skips the QTextDocument layout pass
+        
         # CRS Label (show the rendering CRS, not the source layer CRS)
-        crs_label = QgsLayoutItemLabel(layout)
-        crs_text = f"<b>Projection:</b> {render_crs.description()}<br>({render_crs.authid()})"
-        crs_label.setText(crs_text)
-        crs_label.setFont(QFont("Arial", 7))
-        crs_label.setMode(QgsLayoutItemLabel.ModeHtml)
-        crs_label.attemptMove(QgsLayoutPoint(info_x, collar_content_y, QgsUnitTypes.LayoutMillimeters))
-        crs_label.adjustSizeToText()
-        crs_label.setFrameEnabled(False)
-        layout.addLayoutItem(crs_label)
+        _add_collar_text(layout, "Projection:", f"{render_crs.description()}\n({render_crs.authid()})",
+                         info_x, collar_content_y, 7)
         
         # Attribution Label
         attributions = collect_layer_attributions(config, outlet_config)
         if attributions:
-            attr_label = QgsLayoutItemLabel(layout)
-            attr_text = f"<b>Data Sources:</b><br>{', '.join(attributions)}"
-            attr_label.setText(attr_text)
-            attr_label.setFont(QFont("Arial", 6))
-            attr_label.setMode(QgsLayoutItemLabel.ModeHtml)
-            attr_label.attemptMove(QgsLayoutPoint(info_x, collar_content_y + 8, QgsUnitTypes.LayoutMillimeters))
-            attr_label.adjustSizeToText()
-            attr_label.setFrameEnabled(False)
-            layout.addLayoutItem(attr_label)
+            _add_collar_text(layout, "Data Sources:", ', '.join(attributions), info_x, collar_content_y + 8, 6)
         
         # Generation Date Label
-        date_label = QgsLayoutItemLabel(layout)
         atlas_name = config.get('name', 'Atlas')
         gen_date = datetime.now().strftime('%Y-%m-%d')
-        date_text = f"<b>{atlas_name}</b><br>Generated: {gen_date}"
-        date_label.setText(date_text)
-        date_label.setFont(QFont("Arial", 6))
-        date_label.setMode(QgsLayoutItemLabel.ModeHtml)
-        date_label.attemptMove(QgsLayoutPoint(info_x, collar_content_y + 15, QgsUnitTypes.LayoutMillimeters))
-        date_label.adjustSizeToText()
-        date_label.setFrameEnabled(False)
-        layout.addLayoutItem(date_label)
+        _add_collar_text(layout, atlas_name, f"Generated: {gen_date}", info_x, collar_content_y + 15, 6)
         
     else:
         # No collar - use traditional legend position
@@ -956,20 +1656,202 @@ def create_region_layout(region, project, config, outlet_name):
         legend.attemptMove(QgsLayoutPoint(legend_x, legend_y, QgsUnitTypes.LayoutMillimeters))
         
         legend.setFrameEnabled(True)
+        
+        # Populate the legend from the project once, then freeze it: every
+        # region shares the same layer set, so there is nothing to follow
         legend.setAutoUpdateModel(True)
+        legend.setAutoUpdateModel(False)
         layout.addLayoutItem(legend)
     
-    logger.info(f"Created layout for region: {region['name']} (collar: {enable_collar})")
-    return layout
+    return {
+        'layout': layout,
+        'map_item': map_item,
+        'clip_shape': clip_shape,
+        'map_frame': (map_x, map_y, map_width, map_height),
+        'frame_aspect': map_width / map_height,
+        'to_layer_crs': to_layer_crs,
+        'to_render_crs': to_render_crs,
+        'enable_collar': enable_collar
+    }
+
+
+def fit_bboxes_to_aspect(bounds, aspect):
+    """
+    Grow bboxes about their centres to a width/height aspect ratio.
+    
+    Args:
+        bounds: (N, 4) array of xmin, ymin, xmax, ymax
+        aspect: Target width / height
+        
+    Returns:
+        (N, 4) array; each box is widened or made taller, never shrunk
+    """
+    bounds = np.asarray(bounds, dtype=float).reshape(-1, 4)
+    width = bounds[:, 2] - bounds[:, 0]
+    height = bounds[:, 3] - bounds[:, 1]
+    grow_x = np.maximum(height * aspect - width, 0) / 2
+    grow_y = np.maximum(width / aspect - height, 0) / 2
+    return bounds + np.column_stack([-grow_x, -grow_y, grow_x, grow_y])
+
+
+def region_render_rects(template, regions, bounds=None):
+    """
+    Region bboxes in the rendering CRS.
+    
+    Args:
+        template: Dict returned by _build_layout_template()
+        regions: List of region dicts with bbox
+        bounds: Optional regions_bbox_array() of the regions, if already built
+        
+    Returns:
+        (N, 4) array of xmin, ymin, xmax, ymax in the rendering CRS
+    """
+    rects = regions_bbox_array(regions) if bounds is None else bounds
+    
+    # Transform to the layer CRS, then to the rendering CRS if it differs
+    # (bboxes are in lat/long)
+    transforms = [t for t in (template['to_layer_crs'], template['to_render_crs']) if t is not None]
+    if transforms:
+        rects = rects.copy()
+        for row in rects:
+            rect = QgsRectangle(*row)
+            for transform in transforms:
+                rect = transform.transformBoundingBox(rect)
+            row[:] = rect.xMinimum(), rect.yMinimum(), rect.xMaximum(), rect.yMaximum()
+    return rects
+
+
+def region_map_extents(template, regions, bounds=None, rects=None):
+    """
+    Map extents for regions: each bbox in the rendering CRS, expanded to the
+    map frame's aspect ratio.
+    
+    Args:
+        template: Dict returned by _build_layout_template()
+        regions: List of region dicts with bbox
+        bounds: Optional regions_bbox_array() of the regions, if already built
+        rects: Optional region_render_rects() of the regions, if already built
+        
+    Returns:
+        (N, 4) array of xmin, ymin, xmax, ymax in the rendering CRS
+    """
+    if rects is None:
+        rects = region_render_rects(template, regions, bounds)
+    
+    # Expand all bboxes to fill the map frame in one pass
+    return fit_bboxes_to_aspect(rects, template['frame_aspect'])
+
+
+def clip_frame_rect(map_frame, extent, clip_rect):
+    """
+    Position of a clip rectangle on the page, in layout millimetres.
+    
+    Args:
+        map_frame: (x, y, width, height) of the map item in mm
+        extent: Map extent as xmin, ymin, xmax, ymax
+        clip_rect: Rectangle inside the extent, as xmin, ymin, xmax, ymax
+        
+    Returns:
+        (x, y, width, height) in mm; y grows down the page
+    """
+    map_x, map_y, map_width, map_height = map_frame
+    xmin, ymin, xmax, ymax = extent
+    scale_x = map_width / (xmax - xmin)
+    scale_y = map_height / (ymax - ymin)
+    return (map_x + (clip_rect[0] - xmin) * scale_x,
+            map_y + (ymax - clip_rect[3]) * scale_y,
+            (clip_rect[2] - clip_rect[0]) * scale_x,
+            (clip_rect[3] - clip_rect[1]) * scale_y)
+
+
+def _set_layout_region(template, region, extent=None, clip_rect=None):
+    """
+    Point a layout template at a region: name, map extent and clip.
+    
+    Args:
+        template: Dict returned by _build_layout_template()
+        region: Region dict with bbox and name
+        extent: Optional precomputed region_map_extents() row for the region
+        clip_rect: Optional precomputed region_render_rects() row for the region
+    """
+    layout = template['layout']
+    map_item = template['map_item']
+    layout.setName(f"Region_{region['name']}")
+    
+    if clip_rect is None:
+        clip_rect = region_render_rects(template, [region])[0]
+    if extent is None:
+        extent = region_map_extents(template, [region], rects=np.asarray([clip_rect]))[0]
+    map_item.setExtent(QgsRectangle(*extent))
+    
+    # Clip the map to the region's own bbox, not the aspect-padded extent
+    x, y, width, height = clip_frame_rect(template['map_frame'], extent, clip_rect)
+    clip_shape = template['clip_shape']
+    clip_shape.attemptMove(QgsLayoutPoint(x, y, QgsUnitTypes.LayoutMillimeters))
+    clip_shape.attemptResize(QgsLayoutSize(width, height, QgsUnitTypes.LayoutMillimeters))
+
+
+def create_region_layout(region, project, config, outlet_name, template=None, extent=None, layer_crs=None,
+                         clip_rect=None):
+    """
+    Create a print layout for a region.
+    
+    Args:
+        region: Region dict with bbox, name, caption
+        project: QgsProject instance
+        config: Atlas configuration dict
+        outlet_name: Name of the outlet
+        template: Optional dict to reuse one layout across calls; it is filled
+            on the first call and the same layout is re-pointed at each
+            later region, so export each layout before the next call
+        extent: Optional precomputed map extent (see region_map_extents)
+        layer_crs: Optional CRS of the loaded layers, resolved once by the caller
+        clip_rect: Optional precomputed region bbox in the rendering CRS
+            (see region_render_rects)
+        
+    Returns:
+        QgsPrintLayout configured for the region
+    """
+    if template is None:
+        template = {}
+    if 'layout' not in template:
+        template.update(_build_layout_template(project, config, outlet_name, layer_crs))
+    
+    _set_layout_region(template, region, extent, clip_rect)
+    
+    logger.info("Created layout for region: %s (collar: %s)", region['name'], template['enable_collar'])
+    return template['layout']
+
 
+def _geopdf_settings(dpi=300):
+    """GeoPDF export settings shared by every region export at a resolution."""
+    settings = _pdf_settings.get(dpi)
+    if settings is None:
+        settings = _pdf_settings[dpi] = QgsLayoutExporter.PdfExportSettings()
+        settings.rasterizeWholeImage = False  # Keep vectors as vectors
+        settings.exportMetadata = True  # Include georeferencing
+        settings.writeGeoPdf = True  # Enable GeoPDF
+        settings.dpi = dpi
+    return settings
 
-def export_region_geopdf(layout, output_path):
+
+def export_region_geopdf(layout, output_path, fallback_dpi=150, exporter=None, state=None, dpi=300):
     """
     Export a layout to GeoPDF.
     
+    If GeoPDF export fails the layout is exported again as a rasterized PDF.
+    With a state dict, failures are counted: once GeoPDF export has failed
+    GEOPDF_MAX_FAILURES times, later exports sharing the dict (the other
+    regions of the same layout) go straight to the rasterized PDF instead
+    of failing the GeoPDF export first every time.
+    
     Args:
         layout: QgsPrintLayout to export
         output_path: Path for output PDF file
+        fallback_dpi: Resolution of the rasterized PDF written if GeoPDF export fails
+        exporter: Optional QgsLayoutExporter for this layout, reused across calls
+        state: Optional dict shared by exports of the same layout
+        dpi: GeoPDF resolution (default 300)
         
     Returns:
         True if successful, False otherwise
@@ -978,55 +1860,752 @@ def export_region_geopdf(layout, output_path):
     output_path = Path(output_path)
     output_path.parent.mkdir(parents=True, exist_ok=True)
     
-    # Error code mapping for debugging
-    error_codes = {
-        0: "Success",
-        1: "Canceled", 
-        2: "MemoryError",
-        3: "FileError",
-        4: "PrintError",
-        5: "SvgLayerError",
-        6: "IteratorError"
-    }
-    
-    # Configure PDF export settings
-    settings = QgsLayoutExporter.PdfExportSettings()
-    settings.rasterizeWholeImage = False  # Keep vectors as vectors
-    settings.exportMetadata = True  # Include georeferencing
-    settings.writeGeoPdf = True  # Enable GeoPDF
-    settings.dpi = 300  # High quality
+    if state is None:
+        state = {}
     
-    logger.debug(f"Exporting to: {output_path}")
-    logger.debug(f"Layout has {len(layout.items())} items")
+    logger.debug("Exporting to: %s", output_path)
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Layout has %s items", len(layout.items()))
     
     # Export
-    exporter = QgsLayoutExporter(layout)
-    result = exporter.exportToPdf(str(output_path), settings)
-    
-    if result == QgsLayoutExporter.Success:
-        logger.info(f"✓ Successfully exported GeoPDF to: {output_path}")
+    if exporter is None:
+        exporter = QgsLayoutExporter(layout)
+    if state.get('geopdf_failures', 0) < GEOPDF_MAX_FAILURES:
+        result = exporter.exportToPdf(str(output_path), _geopdf_settings(dpi))
+        if result == QgsLayoutExporter.Success:
+            logger.info("✓ Successfully exported GeoPDF to: %s", output_path)
+            return True
+        
+        error_name = _PDF_EXPORT_ERROR_CODES.get(result, f"Unknown({result})")
+        logger.error("Failed to export GeoPDF: %s (code %s)", error_name, result)
+        logger.info("Retrying with rasterized fallback (non-GeoPDF)...")
+        state['geopdf_failures'] = state.get('geopdf_failures', 0) + 1
+        if state['geopdf_failures'] == GEOPDF_MAX_FAILURES:
+            logger.warning("GeoPDF export failed %s times, rasterizing the remaining regions", GEOPDF_MAX_FAILURES)
+    
+    # Simpler export without GeoPDF features (fallback)
+    settings = QgsLayoutExporter.PdfExportSettings(_geopdf_settings(dpi))  # Leave the shared settings untouched
+    settings.writeGeoPdf = False
+    settings.rasterizeWholeImage = True  # Rasterize to avoid vector issues
+    settings.dpi = min(fallback_dpi, dpi)  # A whole page at 300 dpi is a ~35 Mpx image
+    
+    result2 = exporter.exportToPdf(str(output_path), settings)
+    if result2 == QgsLayoutExporter.Success:
+        logger.warning("⚠ Exported as rasterized PDF (not GeoPDF) to: %s", output_path)
+        logger.warning("  (GeoPDF failed - check layer data for issues)")
         return True
     else:
-        error_name = error_codes.get(result, f"Unknown({result})")
-        logger.error(f"Failed to export GeoPDF: {error_name} (code {result})")
+        logger.error("✗ Rasterized export also failed with code: %s", result2)
+        return False
+
+
+def export_region_pdf_fast(map_item, output_path, dpi=300):
+    """
+    Render only a layout's map body straight to PDF.
+    
+    Skips layout composition and the layout exporter: the map is drawn by a
+    QgsMapRendererCustomPainterJob onto a QPdfWriter page the size of the map
+    frame. There is no collar, legend or GeoPDF georeferencing.
+    
+    Args:
+        map_item: QgsLayoutItemMap already pointed at the region
+        output_path: Path for output PDF file
+        dpi: Output resolution (default 300)
         
-        # Try simpler export without GeoPDF features (fallback)
-        logger.info("Retrying with rasterized fallback (non-GeoPDF)...")
-        settings.writeGeoPdf = False
-        settings.rasterizeWholeImage = True  # Rasterize to avoid vector issues
+    Returns:
+        True if successful, False otherwise
+    """
+    from qgis.core import QgsMapRendererCustomPainterJob
+    from qgis.PyQt.QtCore import QMarginsF
+    from qgis.PyQt.QtGui import QPainter, QPageSize, QPdfWriter
+    
+    # Ensure output directory exists
+    output_path = Path(output_path)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    
+    # Map frame size in mm (layout units) and in output pixels
+    frame = map_item.rect()
+    size_px = QSizeF(round(frame.width() / 25.4 * dpi), round(frame.height() / 25.4 * dpi))
+    map_settings = map_item.mapSettings(map_item.extent(), size_px, dpi, True)
+    
+    writer = QPdfWriter(str(output_path))
+    writer.setResolution(dpi)
+    writer.setPageSize(QPageSize(QSizeF(frame.width(), frame.height()), QPageSize.Millimeter))
+    writer.setPageMargins(QMarginsF(0, 0, 0, 0))
+    
+    painter = QPainter(writer)
+    try:
+        job = QgsMapRendererCustomPainterJob(map_settings, painter)
+        job.renderSynchronously()
+    finally:
+        painter.end()
+    
+    errors = job.errors()
+    if errors:
+        for error in errors:
+            logger.error("✗ Render error in layer %s: %s", error.layerID, error.message)
+        return False
+    
+    logger.info("✓ Successfully exported map PDF to: %s", output_path)
+    return True
+
+
+def _region_layout_iterator(regions, prepare):
+    """
+    Wrap a list of regions as a QgsAbstractLayoutIterator.
+    
+    The QgsLayoutExporter batch APIs pull one layout per region from the
+    iterator, so each region is only prepared right before it is printed.
+    
+    Args:
+        regions: List of region dicts
+        prepare: Callable taking (index, region) and returning its QgsPrintLayout (or None to skip it)
+        
+    Returns:
+        QgsAbstractLayoutIterator; its `exported` attribute lists the regions that produced a layout
+    """
+    # Defined here because QgsAbstractLayoutIterator is only importable after qgis_init()
+    class RegionLayoutIterator(QgsAbstractLayoutIterator):
+        def __init__(self):
+            super().__init__()
+            self.exported = []
+            self._index = -1
+            self._layout = None
+        
+        def count(self):
+            return len(regions)
+        
+        def beginRender(self):
+            self.exported = []
+            self._index = -1
+            return True
         
-        result2 = exporter.exportToPdf(str(output_path), settings)
-        if result2 == QgsLayoutExporter.Success:
-            logger.warning(f"⚠ Exported as rasterized PDF (not GeoPDF) to: {output_path}")
-            logger.warning(f"  (GeoPDF failed - check layer data for issues)")
+        def endRender(self):
             return True
-        else:
-            logger.error(f"✗ Rasterized export also failed with code: {result2}")
+        
+        def next(self):
+            while self._index + 1 < len(regions):
+                self._index += 1
+                region = regions[self._index]
+                self._layout = prepare(self._index, region)
+                if self._layout is not None:
+                    self.exported.append(region)
+                    return True
+                logger.error("Failed to create layout for region %s", region['name'])
             return False
+        
+        def filePath(self, baseFilePath, extension):
+            return str(Path(baseFilePath) / f"page_{regions[self._index]['name']}.{extension}")
+        
+        def layout(self):
+            return self._layout
+    
+    return RegionLayoutIterator()
+
+
+def export_regions_pdf(regions, prepare, output_path, dpi=300):
+    """
+    Export all regions as pages of a single PDF.
+    
+    Unlike export_region_geopdf, one PDF writer is shared by every page, so
+    fonts and writer setup are paid once. The combined document is a plain
+    (non-GeoPDF) PDF.
+    
+    Args:
+        regions: List of region dicts, in page order
+        prepare: Callable taking (index, region) and returning its QgsPrintLayout (or None to skip it)
+        output_path: Path for the combined PDF file
+        dpi: Output resolution (default 300)
+        
+    Returns:
+        List of the regions that were exported, in page order
+    """
+    output_path = Path(output_path)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    
+    settings = QgsLayoutExporter.PdfExportSettings()
+    settings.rasterizeWholeImage = False
+    settings.exportMetadata = True
+    settings.dpi = dpi
+    
+    iterator = _region_layout_iterator(regions, prepare)
+    result, error = QgsLayoutExporter.exportToPdf(iterator, str(output_path), settings)
+    
+    if result == QgsLayoutExporter.Success:
+        logger.info("✓ Successfully exported %s page(s) to: %s", len(iterator.exported), output_path)
+        return iterator.exported
+    
+    logger.error("✗ Failed to export combined PDF (code %s): %s", result, error)
+    return []
+
+
+def apply_region_filter(region, loaded_layers, in_layers, active_layers=None, bounds=None):
+    """
+    Restrict the loaded vector layers to the features of one region.
+    
+    Filtering per region (rather than globally) keeps label deduplication
+    local to each page.
+    
+    Args:
+        region: Region dict with bbox and optional in_layers
+        loaded_layers: Dict of layer name -> loaded QGIS layer
+        in_layers: Default list of layer names shown on region maps
+        active_layers: Optional set of layer names whose extent overlaps the
+            region; other layers are emptied without querying their features
+        bounds: Optional regions_bbox_array() row for the region
+        
+    Returns:
+        Number of features selected across the region's vector layers
+    """
+    # Check if this region has custom in_layers
+    region_in_layers = region.get('in_layers', in_layers)
+    total_features = 0
+    
+    # Region bbox (lat/long) for spatial filtering
+    if bounds is None:
+        bounds = regions_bbox_array([region])[0]
+    region_rect = QgsRectangle(*bounds)
+    wgs84 = _wgs84()
+    layer_rects = {}
+    
+    for layer_name, layer in loaded_layers.items():
+        if not isinstance(layer, QgsVectorLayer):
+            continue
+        
+        # Clear the previous region's filter (and for invisible layers, leave it cleared)
+        layer.setSubsetString("")
+        if layer_name not in region_in_layers:
+            continue
+        
+        # Nothing in this layer can reach the region
+        if active_layers is not None and layer_name not in active_layers:
+            _restrict_to_fids(layer, [])
+            continue
+        
+        # Select features intersecting this region's bbox through the
+        # provider's spatial filter, then restrict the layer to their ids
+        # (one transformed rectangle per CRS, shared by the layers in it)
+        crs = layer.crs()
+        crs_key = crs.authid() or crs.toWkt()
+        rect = layer_rects.get(crs_key)
+        if rect is None:
+            rect = region_rect
+            if crs.isValid() and crs != wgs84:
+                rect = _bbox_transform(crs).transformBoundingBox(region_rect)
+            layer_rects[crs_key] = rect
+        point_index = _point_indexes.get(layer.id())
+        if point_index is not None:
+            fids = [data.id for data in point_index.intersects(rect)]
+        else:
+            request = QgsFeatureRequest().setFilterRect(rect).setFlags(QgsFeatureRequest.ExactIntersect).setNoAttributes()
+            fids = [feature.id() for feature in layer.getFeatures(request)]
+        _restrict_to_fids(layer, fids)
+        if layer.id() in _label_keep_layers:
+            _flag_first_labels(layer, fids)
+        total_features += len(fids)
+        logger.debug("Applied spatial filter to %s: %s features in region %s", layer_name, len(fids), region['name'])
+    return total_features
+
+
+def _flag_first_labels(layer, fids=None):
+    """
+    Set LABEL_KEEP_FIELD on the lowest-id feature of each label value.
+    
+    Equivalent to labeling where $id = minimum($id, group_by:=label), but
+    computed once per region in a single pass instead of by the label engine.
+    
+    Args:
+        layer: In-memory QgsVectorLayer registered in _label_keep_layers
+        fids: Ids of the features in the current region, or None for the whole layer
+    """
+    fields = layer.fields()
+    label_idx = fields.indexOf(_label_keep_layers[layer.id()])
+    keep_idx = fields.indexOf(LABEL_KEEP_FIELD)
+    request = QgsFeatureRequest().setFlags(QgsFeatureRequest.NoGeometry)
+    if fids is not None:
+        request.setFilterFids(fids)
+    request.setSubsetOfAttributes([label_idx])
+    first = {}
+    seen = []
+    for feature in layer.getFeatures(request):
+        label = feature.attribute(label_idx)
+        seen.append(feature.id())
+        if label not in first or feature.id() < first[label]:
+            first[label] = feature.id()
+    if fids is None:
+        fids = seen
+    keep = set(first.values())
+    layer.dataProvider().changeAttributeValues({fid: {keep_idx: int(fid in keep)} for fid in fids})
+
+
+def _restrict_to_fids(layer, fids):
+    """
+    Show only the given features of a layer.
+    
+    Layers with a REGION_FIELD get their flags updated for the features
+    entering or leaving the selection and the constant REGION_SUBSET; other
+    layers get a subset string listing the ids.
+    
+    Args:
+        layer: QgsVectorLayer with its subset string cleared
+        fids: Ids of the features to show
+    """
+    flagged = _region_fids.get(layer.id())
+    if flagged is None:
+        layer.setSubsetString(_fid_subset(layer, fids))
+        return
+    
+    selected = set(fids)
+    region_idx = layer.fields().indexOf(REGION_FIELD)
+    changes = {fid: {region_idx: 0} for fid in flagged - selected}
+    changes.update({fid: {region_idx: 1} for fid in selected - flagged})
+    if changes:
+        layer.dataProvider().changeAttributeValues(changes)
+    _region_fids[layer.id()] = selected
+    layer.setSubsetString(REGION_SUBSET)
+
+
+def _fid_subset(layer, fids):
+    """Subset string selecting exactly the given feature ids of a layer."""
+    # Memory layers take QGIS expressions, OGR layers take OGR SQL
+    fid_ref = "$id" if layer.providerType() == 'memory' else "FID"
+    if not fids:
+        return f"{fid_ref} = -1"  # feature ids are never negative
+    return f"{fid_ref} IN ({','.join(map(str, fids))})"
+
+
+def load_outlet_layers(config, outlet_name, project, t=None):
+    """
+    Load, style and add the outlet's in_layers to a QGIS project.
+    
+    Args:
+        config: Atlas configuration dict
+        outlet_name: Name of the outlet whose in_layers are loaded
+        project: QgsProject to add the layers to
+        t: Start time used for progress logging (default: now)
+        
+    Returns:
+        Dict of layer name -> loaded QGIS layer
+    """
+    if t is None:
+        t = time.time()
+    outlet_config = config['assets'][outlet_name]
+    logger.info("Loading full layers...")
+    loaded_layers = {}
+    in_layers = outlet_config.get('in_layers', [])
+    layers_root = versioning.atlas_path(config, "layers")
+
+    for layer_config in config['dataswale']['layers']:
+        layer_name = layer_config['name']
+        
+        # Skip if not in outlet's in_layers
+        if layer_name not in in_layers:
+            logger.debug("Skipping %s - not in outlet's in_layers", layer_name)
+            continue
+        
+        logger.info("Processing layer: %s...", layer_name)
+        
+        try:
+            # Load layer
+            t0 = time.perf_counter_ns()
+            layer = load_full_layer(layer_config, config, layers_root)
+            if layer is None:
+                logger.warning("⚠ Skipping layer %s - failed to load", layer_name)
+                continue
+            t1 = time.perf_counter_ns()
+            
+            # Apply styling (pass config for custom icons and feature_scale)
+            feature_scale = outlet_config.get('feature_scale', 1.0)
+            apply_basic_styling(layer, layer_config, config, feature_scale)
+            t2 = time.perf_counter_ns()
+            
+            # Add to project
+            project.addMapLayer(layer)
+            loaded_layers[layer_name] = layer
+            
+            logger.info("✓ Loaded and styled layer: %s (load %.0f ms, style %.0f ms) [%.2fs]",
+                        layer_name, (t1 - t0) / 1e6, (t2 - t1) / 1e6, time.time() - t)
+            
+        except Exception as e:
+            logger.error("✗ Error loading layer %s: %s", layer_name, e)
+            logger.debug("Layer config: %s", layer_config)
+            # Continue with other layers
+            continue
+    
+    return loaded_layers
+
+
+def outlet_inputs_mtime(config, outlet_name, regions_geojson_path=None):
+    """
+    Newest modification time among the files an outlet's region maps read.
+    
+    Args:
+        config: Atlas configuration dict
+        outlet_name: Name of the outlet whose in_layers are checked
+        regions_geojson_path: Optional regions GeoJSON to include
+        
+    Returns:
+        Latest mtime in seconds, or None if any input is missing
+    """
+    in_layers = config['assets'][outlet_name].get('in_layers', [])
+    layers_root = versioning.atlas_path(config, "layers")
+    paths = [layer_source_path(layer_config, config, layers_root)
+             for layer_config in config['dataswale']['layers']
+             if layer_config['name'] in in_layers]
+    if regions_geojson_path:
+        paths.append(Path(regions_geojson_path))
+    try:
+        return max((path.stat().st_mtime for path in paths), default=0.0)
+    except OSError:
+        return None
+
+
+def region_pdf_path(config, outlet_name, region, outlet_dir=None):
+    """
+    Path of the per-region PDF for an outlet.
+    
+    Args:
+        config: Atlas configuration dict
+        outlet_name: Name of the outlet
+        region: Region dict with 'name'
+        outlet_dir: Optional outlet directory, if already resolved by the caller
+        
+    Returns:
+        Path to page_<region name>.pdf in the outlet directory
+    """
+    if outlet_dir is None:
+        outlet_dir = versioning.atlas_path(config, "outlets") / outlet_name
+    return outlet_dir / f"page_{region['name']}.pdf"
+
+
+def _layer_extents_array(loaded_layers):
+    """
+    Full extents of the loaded layers in WGS84, for overlap tests against regions.
+    
+    Returns:
+        (layer names, (M, 4) array of west, south, east, north)
+    """
+    wgs84 = _wgs84()
+    names = list(loaded_layers)
+    bounds = []
+    for name in names:
+        layer = loaded_layers[name]
+        extent = layer.extent()
+        if layer.crs().isValid() and layer.crs() != wgs84:
+            extent = _crs_transform(layer.crs(), wgs84).transformBoundingBox(extent)
+        bounds.append([extent.xMinimum(), extent.yMinimum(), extent.xMaximum(), extent.yMaximum()])
+    return names, np.array(bounds, dtype=float).reshape(-1, 4)
+
+
+def _set_render_context(config, outlet_name, project, loaded_layers, regions, t, dpi=300):
+    """Record the state _prepare_region() and _render_region() read in this process."""
+    global _render_context
+    
+    # Which layers can contribute anything to each region at all
+    layer_names, layer_bounds = _layer_extents_array(loaded_layers)
+    bounds = regions_bbox_array(regions)
+    overlaps = bbox_overlaps(bounds, layer_bounds)
+    
+    _render_context = {
+        'config': config,
+        'outlet_name': outlet_name,
+        'project': project,
+        'loaded_layers': loaded_layers,
+        'in_layers': config['assets'][outlet_name].get('in_layers', []),
+        'fast_export': config['assets'][outlet_name].get('fast_export', False),
+        'fallback_dpi': config['assets'][outlet_name].get('fallback_dpi', 150),
+        'skip_empty': config['assets'][outlet_name].get('skip_empty', False),
+        'dpi': dpi,
+        'outlet_dir': versioning.atlas_path(config, "outlets") / outlet_name,
+        'active_layers': [{layer_names[j] for j in np.flatnonzero(row)} for row in overlaps],
+        'regions': regions,
+        'bounds': bounds,
+        'layer_crs': project_layer_crs(project),
+        'total': len(regions),
+        'start': t,
+        # Filled, with 'clip_rects' and 'extents', by the first _prepare_region()
+        # call in this process
+        'layout_template': {},
+        'clip_rects': None,
+        'extents': None
+    }
+
+
+def _init_render_worker(config, outlet_name, regions, t, threads, dpi=300):
+    """
+    Pool initializer for start methods that do not inherit the parent's state.
+    
+    Spawned workers start without QGIS or any loaded layers, so each one
+    initializes QGIS and loads the outlet's layers once up front.
+    """
+    qgis_init(max_threads=threads)
+    project = QgsProject.instance()
+    detach_cached_layers(project)
+    project.clear()
+    loaded_layers = load_outlet_layers(config, outlet_name, project, t)
+    _set_render_context(config, outlet_name, project, loaded_layers, regions, t, dpi)
+
+
+def _prepare_region(i, region, timings=None):
+    """
+    Filter the loaded layers to a region and point the shared layout at it.
+    
+    Args:
+        i: Index of the region in the outlet's region list
+        region: Region dict
+        timings: Optional dict to receive 'filter' and 'layout' stage times in ns,
+            and under 'features' the number of vector features in the region
+        
+    Returns:
+        QgsPrintLayout for the region, or None on failure
+    """
+    context = _render_context
+    active_layers = context['active_layers'][i]
+    
+    # Apply spatial filter to each layer for this region
+    t0 = time.perf_counter_ns()
+    features = apply_region_filter(region, context['loaded_layers'], context['in_layers'], active_layers,
+                                   context['bounds'][i])
+    t1 = time.perf_counter_ns()
+    
+    # Create layout for region; map extents are computed for every region
+    # at once when the layout template is first built
+    template = context['layout_template']
+    if 'layout' not in template:
+        template.update(_build_layout_template(context['project'], context['config'], context['outlet_name'],
+                                               context['layer_crs']))
+        context['clip_rects'] = region_render_rects(template, context['regions'], context['bounds'])
+        context['extents'] = region_map_extents(template, context['regions'], rects=context['clip_rects'])
+    layout = create_region_layout(region, context['project'], context['config'], context['outlet_name'],
+                                  template=template, extent=context['extents'][i],
+                                  clip_rect=context['clip_rects'][i])
+    
+    # Only render layers whose extent reaches this region, in layer tree order.
+    # (An empty layer list would make the map fall back to all layers, and a
+    # region no layer reaches renders empty either way.)
+    if layout is not None and active_layers:
+        ids = {context['loaded_layers'][name].id() for name in active_layers}
+        layer_order = context['project'].layerTreeRoot().layerOrder()
+        context['layout_template']['map_item'].setLayers([layer for layer in layer_order if layer.id() in ids])
+    
+    if timings is not None:
+        timings['filter'] = t1 - t0
+        timings['features'] = features
+        timings['layout'] = time.perf_counter_ns() - t1
+    return layout
+
+
+def _render_region(task):
+    """
+    Filter, lay out and export a single region to GeoPDF (or, with the
+    outlet's 'fast_export' option, to a map-only PDF).
+    
+    Uses the project and layers in the module render context, so it can run
+    either in the parent process or in a render worker.
+    
+    Args:
+        task: (index, region dict) tuple
+        
+    Returns:
+        (index, output PDF path as str, '' if the region was skipped as
+        empty, or None if the region failed)
+    """
+    i, region = task
+    context = _render_context
+    t = context['start']
+    logger.info("Processing region %s/%s: %s [%.2fs]", i + 1, context['total'], region['name'], time.time() - t)
+    
+    timings = {}
+    usage_before = _usage_sample()
+    layout = _prepare_region(i, region, timings)
+    
+    # Validate layout before export
+    if layout is None:
+        logger.error("Failed to create layout for region %s", region['name'])
+        return i, None
+    
+    # With the outlet's 'skip_empty' option, regions with no vector features
+    # and no raster layers reaching them aren't exported at all
+    if context['skip_empty'] and not timings['features'] and not any(
+            not isinstance(context['loaded_layers'][name], QgsVectorLayer) for name in context['active_layers'][i]):
+        logger.info("Region %s: skip (empty)", region['name'])
+        return i, ''
+    
+    # The layout's map item, kept by the template that built it
+    map_item = context['layout_template']['map_item']
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Map extent: %s", map_item.extent().toString())
+        logger.debug("Map CRS: %s", map_item.crs().authid())
+        logger.debug("Visible layers in project: %s", len(context['project'].mapLayers()))
+    
+    output_path = region_pdf_path(context['config'], context['outlet_name'], region, context['outlet_dir'])
+    export_start = time.perf_counter_ns()
+    if context['fast_export']:
+        # Map body only, no layout composition
+        success = export_region_pdf_fast(map_item, output_path, context['dpi'])
+    else:
+        # Export to GeoPDF, with one exporter bound to the shared layout
+        template = context['layout_template']
+        if 'exporter' not in template:
+            template['exporter'] = QgsLayoutExporter(layout)
+        success = export_region_geopdf(layout, output_path, context['fallback_dpi'], exporter=template['exporter'],
+                                       state=template, dpi=context['dpi'])
+    timings['export'] = time.perf_counter_ns() - export_start
+    _log_stage_summary(region, timings, usage_before, _usage_sample())
+    
+    if success:
+        return i, str(output_path)
+    return i, None
+
+
+def _usage_sample():
+    """Sample (wall ns, CPU seconds, bytes read or None) for this process."""
+    read_bytes = None
+    if psutil is not None:
+        try:
+            read_bytes = psutil.Process().io_counters().read_bytes
+        except (AttributeError, psutil.Error):
+            # io_counters() isn't available on every platform (e.g. macOS)
+            pass
+    return time.perf_counter_ns(), time.process_time(), read_bytes
+
+
+def _log_stage_summary(region, timings, before, after):
+    """
+    Log one line of per-stage timings and resource use for a region.
+    
+    High CPU% with little data read means rendering is compute-bound; low
+    CPU% or heavy reads point at I/O or memory as the bottleneck.
+    """
+    wall_ns = after[0] - before[0]
+    cpu_percent = 100 * (after[1] - before[1]) / (wall_ns / 1e9) if wall_ns else 0
+    read_mb = "n/a" if before[2] is None or after[2] is None else f"{(after[2] - before[2]) / 1e6:.1f}"
+    peak_rss_mb = "n/a"
+    if resource is not None:
+        # ru_maxrss is KiB on Linux, bytes on macOS
+        peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        peak_rss_mb = f"{peak_rss / (1e6 if sys.platform == 'darwin' else 1e3):.0f}"
+    logger.info("Region %s | filter %.0f ms | layout %.0f ms | export %.0f ms | read %s MB | cpu %.0f%% | peak RSS %s MB",
+                region['name'], timings.get('filter', 0) / 1e6, timings.get('layout', 0) / 1e6,
+                timings.get('export', 0) / 1e6, read_mb, cpu_percent, peak_rss_mb)
+
+
+def render_regions_parallel(tasks, workers, config, outlet_name, regions, t, dpi=300):
+    """
+    Render regions across a pool of worker processes.
+    
+    On Linux the pool forks, so workers inherit the initialized QGIS
+    application and the already loaded and styled layers copy-on-write.
+    Elsewhere workers are spawned and reload everything once each: macOS
+    offers fork, but Qt and the system frameworks crash in forked children.
+    
+    Each region is its own future, so a region that raises, or a worker
+    that crashes inside QGIS, fails only the regions it takes down instead
+    of hanging or aborting the whole run.
+    
+    Args:
+        tasks: List of (index, region dict) tuples
+        workers: Number of worker processes
+        config: Atlas configuration dict
+        outlet_name: Name of the outlet being rendered
+        regions: Full region list the task indices refer to
+        t: Start time used for progress logging
+        dpi: Output resolution, for spawned workers' render context
+        
+    Returns:
+        List of (index, output PDF path or None), in completion order
+    """
+    # Extra workers would sit idle (and, when spawned, still load every layer)
+    workers = min(workers, len(tasks))
+    
+    # Share the CPUs between workers rather than letting each worker's QGIS
+    # thread pool size itself for the whole machine
+    threads = max(1, (os.cpu_count() or 1) // workers)
+    
+    if sys.platform.startswith('linux'):
+        context = multiprocessing.get_context('fork')
+        initializer, initargs = QgsApplication.setMaxThreads, (threads,)
+    else:
+        context = multiprocessing.get_context('spawn')
+        initializer, initargs = _init_render_worker, (config, outlet_name, regions, t, threads, dpi)
+    
+    logger.info("Rendering %s region(s) with %s %s worker(s), %s thread(s) each",
+                len(tasks), workers, context.get_start_method(), threads)
+    results = []
+    with ProcessPoolExecutor(workers, mp_context=context, initializer=initializer, initargs=initargs) as executor:
+        futures = {executor.submit(_render_region, task): task for task in tasks}
+        for future in as_completed(futures):
+            i, region = futures[future]
+            try:
+                results.append(future.result())
+            except BrokenProcessPool:
+                logger.error("Render worker died before finishing region %s", region['name'])
+                results.append((i, None))
+            except Exception as e:
+                logger.error("Rendering region %s failed: %s", region['name'], e)
+                results.append((i, None))
+    return results
+
+
+def write_regions_outputs(config, outlet_name, regions_list, regions_html=[], first_n=0):
+    """
+    Write regions_config.json and any HTML outputs for a regions outlet.
+    
+    Args:
+        config: Atlas configuration dict
+        outlet_name: Name of the outlet
+        regions_list: Region dicts with their outputs
+        regions_html: List of (path, content) tuples to write
+        first_n: regions_config.json is only saved for full runs (0)
+    """
+    # Save regions config as JSON
+    if first_n == 0:
+        regions_json_path = versioning.atlas_path(config, "outlets") / outlet_name / "regions_config.json"
+        with open(regions_json_path, "wb") as f:
+            f.write(dump_json_bytes(regions_list, indent=True))
+        logger.info("Saved regions config to: %s", regions_json_path)
+    
+    # Write HTML outputs, overlapping the writes (many small files, often on
+    # a network filesystem where each open/write/close waits on a round trip)
+    outlet_dir = versioning.atlas_path(config, "outlets") / outlet_name
+    
+    def write_output(output):
+        outfile_path, outfile_content = output
+        versioned_path = outlet_dir / outfile_path
+        logger.info("Writing region output to: %s", versioned_path)
+        versioned_path.write_text(outfile_content)
+    
+    if regions_html:
+        for parent in {(outlet_dir / outfile_path).parent for outfile_path, _ in regions_html}:
+            parent.mkdir(parents=True, exist_ok=True)
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            list(executor.map(write_output, regions_html))
+
+
+def render_worker_count(outlet_config):
+    """
+    Number of region render workers an outlet asks for.
+    
+    Args:
+        outlet_config: Outlet configuration dict; 'render_workers' is a
+            number (or a numeric string) or 'auto' for one per CPU
+        
+    Returns:
+        Worker count; 1 if the option is missing or not understood
+    """
+    render_workers = outlet_config.get('render_workers', 1)
+    if render_workers == 'auto':
+        return os.cpu_count() or 1
+    try:
+        return int(render_workers)
+    except (TypeError, ValueError):
+        logger.error("Invalid render_workers %r (expected a number or 'auto'), rendering with one worker",
+                     render_workers)
+        return 1
 
 
 def outlet_regions_qgis(config, outlet_name, regions_geojson_path=None, regions=None, 
-                        regions_html=[], skips=[], reuse_extracts=False, first_n=0):
+                        regions_html=[], skips=[], reuse_extracts=False, first_n=0, dpi=None):
     """
     Generate region maps using QGIS API (GeoPDF output).
     
@@ -1042,6 +2621,7 @@ def outlet_regions_qgis(config, outlet_name, regions_geojson_path=None, regions=
         skips: List of processing steps to skip
         reuse_extracts: Ignored (for compatibility with GRASS version)
         first_n: Only process first N regions (for testing)
+        dpi: Output resolution; defaults to the outlet's 'dpi' option, or 300
         
     Returns:
         List of region dicts with output paths
@@ -1049,9 +2629,12 @@ def outlet_regions_qgis(config, outlet_name, regions_geojson_path=None, regions=
     t = time.time()
     swale_name = config['name']
     outlet_config = config['assets'][outlet_name]
+    if dpi is None:
+        dpi = outlet_config.get('dpi', 300)
+    render_workers = render_worker_count(outlet_config)
     
-    logger.info(f"=== QGIS Outlet Regions Start ===")
-    logger.info(f"Atlas: {swale_name}, Outlet: {outlet_name}")
+    logger.info("=== QGIS Outlet Regions Start ===")
+    logger.info("Atlas: %s, Outlet: %s", swale_name, outlet_name)
     
     if 'region_maps' in skips:
         logger.info("Skipping region maps generation (in skips list)")
@@ -1059,15 +2642,15 @@ def outlet_regions_qgis(config, outlet_name, regions_geojson_path=None, regions=
     
     # Load regions from GeoJSON if path provided
     if regions_geojson_path:
-        logger.info(f"Loading regions from: {regions_geojson_path}")
+        logger.info("Loading regions from: %s", regions_geojson_path)
         regions_list = load_regions_from_geojson(regions_geojson_path, first_n=first_n)
-        logger.info(f"Loaded {len(regions_list)} region(s)")
+        logger.info("Loaded %s region(s)", len(regions_list))
     elif regions:
         # Legacy compatibility - regions already provided
-        logger.info(f"Using provided regions list: {len(regions)} region(s)")
+        logger.info("Using provided regions list: %s region(s)", len(regions))
         regions_list = regions
         if first_n > 0:
-            logger.info(f"Limiting to first {first_n} regions...")
+            logger.info("Limiting to first %s regions...", first_n)
             regions_list = regions_list[:first_n]
     else:
         logger.error("No regions provided! Specify regions_geojson_path or regions parameter")
@@ -1077,111 +2660,75 @@ def outlet_regions_qgis(config, outlet_name, regions_geojson_path=None, regions=
         logger.warning("No regions to process!")
         return []
     
-    logger.info(f"Starting QGIS initialization...")
+    # Incremental rebuilds skip regions whose PDF is newer than every input
+    # layer and the regions file; styling changes aren't tracked, so opt-in
+    pending = set(range(len(regions_list)))
+    if outlet_config.get('incremental', False) and not outlet_config.get('single_pdf', False):
+        input_mtime = outlet_inputs_mtime(config, outlet_name, regions_geojson_path)
+        if input_mtime is not None:
+            outlet_dir = versioning.atlas_path(config, "outlets") / outlet_name
+            for i, region in enumerate(regions_list):
+                output_path = region_pdf_path(config, outlet_name, region, outlet_dir)
+                if output_path.exists() and output_path.stat().st_mtime > input_mtime:
+                    logger.info("Region %s: skip (up-to-date)", region['name'])
+                    if 'outputs' not in region:
+                        region['outputs'] = {}
+                    region['outputs']['pdf'] = str(output_path)
+                    pending.discard(i)
+        if not pending:
+            logger.info("All %s region PDF(s) up to date", len(regions_list))
+            write_regions_outputs(config, outlet_name, regions_list, regions_html, first_n)
+            logger.info("=== Completed all regions in %.2fs ===", time.time() - t)
+            return regions_list
+    
+    logger.info("Starting QGIS initialization...")
     qgis_init()
-    logger.info(f"QGIS initialized")    
+    logger.info("QGIS initialized")
     try:
         # Create project
         project = QgsProject.instance()
+        detach_cached_layers(project)
         project.clear()
         
         # Load all full layers once
-        logger.info("Loading full layers...")
-        loaded_layers = {}
-        in_layers = outlet_config.get('in_layers', [])
- 
-        for layer_config in config['dataswale']['layers']:
-            layer_name = layer_config['name']
-            
-            # Skip if not in outlet's in_layers
-            if layer_name not in in_layers:
-                logger.debug(f"Skipping {layer_name} - not in outlet's in_layers")
-                continue
-            
-            logger.info(f"Processing layer: {layer_name}...")
-            
-            try:
-                # Load layer
-                layer = load_full_layer(layer_config, config)
-                if layer is None:
-                    logger.warning(f"⚠ Skipping layer {layer_name} - failed to load")
-                    continue
-                
-                # Apply styling (pass config for custom icons and feature_scale)
-                feature_scale = outlet_config.get('feature_scale', 1.0)
-                apply_basic_styling(layer, layer_config, config, feature_scale)
-                
-                # Add to project
-                project.addMapLayer(layer)
-                loaded_layers[layer_name] = layer
-                
-                logger.info(f"✓ Loaded and styled layer: {layer_name} [{time.time() - t:.2f}s]")
-                
-            except Exception as e:
-                logger.error(f"✗ Error loading layer {layer_name}: {e}")
-                logger.debug(f"Layer config: {layer_config}")
-                # Continue with other layers
-                continue
+        loaded_layers = load_outlet_layers(config, outlet_name, project, t)
         
-        logger.info(f"Loaded {len(loaded_layers)} layer(s) total")
+        logger.info("Loaded %s layer(s) total", len(loaded_layers))
         
-        # Process each region
-        for i, region in enumerate(regions_list):
-            logger.info(f"Processing region {i+1}/{len(regions_list)}: {region['name']} [{time.time() - t:.2f}s]")
-            
-            # Check if this region has custom in_layers
-            region_in_layers = region.get('in_layers', in_layers)
-            
-            # Get region bbox for spatial filtering
-            bbox = region['bbox']
-            bbox_wkt = f"POLYGON(({bbox['west']} {bbox['south']}, {bbox['east']} {bbox['south']}, {bbox['east']} {bbox['north']}, {bbox['west']} {bbox['north']}, {bbox['west']} {bbox['south']}))"
-            
-            # Apply spatial filter to each layer for this region
-            # This ensures labels are deduplicated per-region (not globally)
-            for layer_name, layer in loaded_layers.items():
-                visible = layer_name in region_in_layers
-                
-                if visible and isinstance(layer, QgsVectorLayer):
-                    # Filter to only show features that intersect this region's bbox
-                    # Use st_intersects with the bbox geometry
-                    filter_expr = f"intersects($geometry, geom_from_wkt('{bbox_wkt}'))"
-                    layer.setSubsetString(filter_expr)
-                    feature_count = layer.featureCount()
-                    logger.info(f"Applied spatial filter to {layer_name}: {feature_count} features in region {region['name']}")
-                elif isinstance(layer, QgsVectorLayer):
-                    # Clear filter for invisible layers (though they won't be rendered anyway)
-                    layer.setSubsetString("")
-            
-            # Create layout for region
-            layout = create_region_layout(region, project, config, outlet_name)
-            
-            # Validate layout before export
-            if layout is None:
-                logger.error(f"Failed to create layout for region {region['name']}")
-                continue
-            
-            map_items = [item for item in layout.items() if isinstance(item, QgsLayoutItemMap)]
-            if not map_items:
-                logger.error(f"No map items in layout for region {region['name']}")
-                continue
-            
-            map_item = map_items[0]
-            logger.debug(f"Map extent: {map_item.extent().toString()}")
-            logger.debug(f"Map CRS: {map_item.crs().authid()}")
-            logger.debug(f"Visible layers in project: {len(project.mapLayers())}")
-            
-            # Export to GeoPDF
-            output_path = versioning.atlas_path(config, "outlets") / outlet_name / f"page_{region['name']}.pdf"
-            success = export_region_geopdf(layout, output_path)
-            
-            if success:
-                # Store output path in region
+        _set_render_context(config, outlet_name, project, loaded_layers, regions_list, t, dpi)
+        
+        if outlet_config.get('single_pdf', False):
+            # One multi-page PDF: each region is filtered and laid out just
+            # before its page is printed, sharing a single PDF writer
+            output_path = versioning.atlas_path(config, "outlets") / outlet_name / f"{outlet_name}.pdf"
+            exported = export_regions_pdf(regions_list, _prepare_region, output_path, dpi)
+            for page_number, region in enumerate(exported, start=1):
                 if 'outputs' not in region:
                     region['outputs'] = {}
                 region['outputs']['pdf'] = str(output_path)
-                logger.info(f"✓ Completed region {region['name']} [{time.time() - t:.2f}s]")
+                region['outputs']['page'] = page_number
+            logger.info("✓ Exported %s region page(s) [%.2fs]", len(exported), time.time() - t)
+        else:
+            # Export each region to its own GeoPDF
+            # Render in Z-order so consecutive regions are spatial neighbors
+            # and reuse warm raster/feature caches; outputs keep their names
+            tasks = sorted(((i, region) for i, region in enumerate(regions_list) if i in pending),
+                           key=lambda task: utils.bbox_morton_code(task[1]['bbox']))
+            if render_workers > 1 and len(tasks) > 1:
+                results = render_regions_parallel(tasks, render_workers, config, outlet_name, regions_list, t, dpi)
             else:
-                logger.error(f"✗ Failed to export region {region['name']}")
+                results = map(_render_region, tasks)
+            
+            for i, pdf_path in results:
+                region = regions_list[i]
+                if pdf_path:
+                    # Store output path in region
+                    if 'outputs' not in region:
+                        region['outputs'] = {}
+                    region['outputs']['pdf'] = pdf_path
+                    logger.info("✓ Completed region %s [%.2fs]", region['name'], time.time() - t)
+                elif pdf_path is None:
+                    logger.error("✗ Failed to export region %s", region['name'])
         
         # Clear spatial filters from all layers (cleanup)
         for layer_name, layer in loaded_layers.items():
@@ -1189,21 +2736,9 @@ def outlet_regions_qgis(config, outlet_name, regions_geojson_path=None, regions=
                 layer.setSubsetString("")
         logger.debug("Cleared spatial filters from all layers")
         
-        # Save regions config as JSON
-        if first_n == 0:
-            regions_json_path = versioning.atlas_path(config, "outlets") / outlet_name / "regions_config.json"
-            with open(regions_json_path, "w") as f:
-                json.dump(regions_list, f, indent=2)
-            logger.info(f"Saved regions config to: {regions_json_path}")
-        
-        # Write HTML outputs
-        for outfile_path, outfile_content in regions_html:
-            versioned_path = versioning.atlas_path(config, "outlets") / outlet_name / outfile_path
-            logger.info(f"Writing region output to: {versioned_path}")
-            with open(versioned_path, "w") as f:
-                f.write(outfile_content)
-        
-        logger.info(f"=== Completed all regions in {time.time() - t:.2f}s ===")
+        write_regions_outputs(config, outlet_name, regions_list, regions_html, first_n)
+        
+        logger.info("=== Completed all regions in %.2fs ===", time.time() - t)
         return regions_list
         
     finally:
@@ -1236,14 +2771,14 @@ def outlet_runbook_qgis(config, outlet_name='runbook', skips=[], start_at=0, lim
     regions_path = versioning.atlas_path(config, "layers") / regions_layer_name / f"{regions_layer_name}.geojson"
     
     if not regions_path.exists():
-        logger.error(f"Regions layer not found: {regions_path}")
+        logger.error("Regions layer not found: %s", regions_path)
         return []
     
     # Convert legacy limit parameter to first_n
     if limit > 0 and first_n == 0:
         first_n = limit
     
-    logger.info(f"Running QGIS runbook outlet from: {regions_path}")
+    logger.info("Running QGIS runbook outlet from: %s", regions_path)
     
     return outlet_regions_qgis(
         config=config,
@@ -1273,7 +2808,7 @@ def outlet_gazetteer_qgis(config, outlet_name='gazetteer', skips=[], first_n=0):
     # Import here to avoid circular dependency
     from outlets import generate_gazetteerregions
     
-    logger.info(f"Running QGIS gazetteer outlet")
+    logger.info("Running QGIS gazetteer outlet")
     
     # Generate grid regions (still uses existing logic)
     gaz_regions, gaz_html = generate_gazetteerregions(config, outlet_name)
@@ -1285,7 +2820,9 @@ def outlet_gazetteer_qgis(config, outlet_name='gazetteer', skips=[], first_n=0):
         regions=gaz_regions,
         regions_html=gaz_html,
         skips=skips,
-        first_n=first_n
+        first_n=first_n,
+        # Overview pages are read zoomed out; 300 dpi is kept for runbook detail
+        dpi=config['assets'][outlet_name].get('dpi', 150)
     )
 
 asset_methods = {
@@ -20,40 +20,6 @@ from datetime import datetime
 # Set Qt to use offscreen platform for headless operation
 os.environ['QT_QPA_PLATFORM'] = 'offscreen'
 
-from qgis.core import (
-    QgsApplication,
-    QgsVectorLayer,
-    QgsRasterLayer,
-    QgsProject,
-    QgsLayoutExporter,
-    QgsLayoutItemMap,
-    QgsLayoutItemMapOverview,
-    QgsLayoutItemLegend,
-    QgsLayoutItemScaleBar,
-    QgsLayoutItemLabel,
-    QgsLayoutItemShape,
-    QgsLayoutItemPage,
-    QgsLayoutPoint,
-    QgsLayoutSize,
-    QgsLayoutMeasurement,
-    QgsPrintLayout,
-    QgsScaleBarSettings,
-    QgsUnitTypes,
-    QgsRectangle,
-    QgsCoordinateReferenceSystem,
-    QgsCoordinateTransform,
-    QgsCoordinateTransformContext,
-    QgsMapClippingRegion,
-    QgsTextFormat,
-    QgsLayerTreeLayer,
-    QgsGeometry,
-    QgsPointXY,
-    QgsFillSymbol,
-    QgsVectorFileWriter,
-    QgsFeature
-)
-from qgis.PyQt.QtGui import QColor, QFont
-
 # Import local modules
 try:
     from . import versioning
@@ -70,6 +36,57 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+def _import_qgis():
+    """
+    Import the QGIS/Qt classes used by this module into module globals.
+
+    Like outlets_qgis, QGIS is only imported once an atlas outlet runs, so
+    importing this module (as atlas.py does) doesn't load QGIS and Qt.
+    """
+    global QgsApplication, QgsVectorLayer, QgsRasterLayer, QgsProject, \
+        QgsLayoutExporter, QgsLayoutItemMap, QgsLayoutItemMapOverview, \
+        QgsLayoutItemLegend, QgsLayoutItemScaleBar, QgsLayoutItemLabel, \
+        QgsLayoutItemShape, QgsLayoutItemPage, QgsLayoutPoint, QgsLayoutSize, \
+        QgsLayoutMeasurement, QgsPrintLayout, QgsScaleBarSettings, QgsUnitTypes, \
+        QgsRectangle, QgsCoordinateReferenceSystem, QgsCoordinateTransform, \
+        QgsCoordinateTransformContext, QgsMapClippingRegion, QgsTextFormat, \
+        QgsLayerTreeLayer, QgsGeometry, QgsPointXY, QgsFillSymbol, \
+        QgsVectorFileWriter, QgsFeature, QColor, QFont
+    from qgis.core import (
+        QgsApplication,
+        QgsVectorLayer,
+        QgsRasterLayer,
+        QgsProject,
+        QgsLayoutExporter,
+        QgsLayoutItemMap,
+        QgsLayoutItemMapOverview,
+        QgsLayoutItemLegend,
+        QgsLayoutItemScaleBar,
+        QgsLayoutItemLabel,
+        QgsLayoutItemShape,
+        QgsLayoutItemPage,
+        QgsLayoutPoint,
+        QgsLayoutSize,
+        QgsLayoutMeasurement,
+        QgsPrintLayout,
+        QgsScaleBarSettings,
+        QgsUnitTypes,
+        QgsRectangle,
+        QgsCoordinateReferenceSystem,
+        QgsCoordinateTransform,
+        QgsCoordinateTransformContext,
+        QgsMapClippingRegion,
+        QgsTextFormat,
+        QgsLayerTreeLayer,
+        QgsGeometry,
+        QgsPointXY,
+        QgsFillSymbol,
+        QgsVectorFileWriter,
+        QgsFeature
+    )
+    from qgis.PyQt.QtGui import QColor, QFont
+
+
 def outlet_runbook_qgis_atlas(config, outlet_name, only_generate=[]):
     """
     Generate a runbook PDF using QGIS Atlas functionality.
@@ -97,10 +114,12 @@ def outlet_runbook_qgis_atlas(config, outlet_name, only_generate=[]):
     logger.info(f"Starting QGIS Atlas. Outlet config: {outlet_config}. Road Layers config: {config['dataswale']['layers']}")
     # Initialize QGIS using singleton pattern (safe for repeated calls in notebooks)
     outlets_qgis.qgis_init()
+    _import_qgis()
     
     try:
         # Create project and load layers
         project = QgsProject.instance()
+        outlets_qgis.detach_cached_layers(project)
         project.clear()
         
         logger.info(f"Loading layers for atlas generation...")
@@ -389,7 +408,12 @@ def create_atlas_layout(project, coverage_layer, config, outlet_name):
     # The atlasClippingSettings() returns a reference, so we just modify it directly
     atlas_clipping = map_item.atlasClippingSettings()
     atlas_clipping.setEnabled(True)
-    atlas_clipping.setFeatureClippingType(QgsMapClippingRegion.FeatureClippingType.ClipToIntersection)
+    # Coverage features are axis-aligned squares (see outlet_runbook_qgis_atlas),
+    # so clipping the painter to them draws the same page as intersecting every
+    # feature's geometry with them in GEOS, at none of the per-feature cost.
+    # Labels are kept inside the square, as they were with clipped geometries.
+    atlas_clipping.setFeatureClippingType(QgsMapClippingRegion.FeatureClippingType.ClipPainterOnly)
+    atlas_clipping.setForceLabelsInsideFeature(True)
     
     # Explicitly set which layers to clip (all vector layers)
     layers_to_clip = [layer for layer in project.mapLayers().values() 
@@ -786,63 +810,64 @@ def export_atlas(layout, output_dir, atlas_name):
         logger.error(f"✗ Multi-page PDF export failed: {error_msg}")
         results['status'] = 'partial'
     
-    # Export individual PDFs per region
+    # Export individual PDFs per region in one pass over the atlas, reusing
+    # the exporter's render state instead of exporting page by page
     individual_dir = output_dir / "individual_pages"
     individual_dir.mkdir(exist_ok=True)
     
     logger.info(f"Exporting individual PDFs to: {individual_dir}")
     
-    # Iterate through atlas features
+    # File names: region name with anything but (Unicode) letters, digits,
+    # '-' and '_' replaced, or region_<n>
+    coverage_layer = atlas.coverageLayer()
+    has_name = 'name' in coverage_layer.fields().names()
+    if has_name:
+        atlas.setFilenameExpression(
+            "if(coalesce(\"name\", '') = '', 'region_' || @atlas_featurenumber, "
+            "regexp_replace(\"name\", '[^\\\\p{L}\\\\p{N}_-]', '_'))"
+        )
+    else:
+        atlas.setFilenameExpression("'region_' || @atlas_featurenumber")
+    
+    # Read each page's file name from the atlas, in the atlas's own feature
+    # order, with the modification time of any file already there, so files
+    # left by an earlier run are not counted as this run's output
+    base_path = str(individual_dir / "region.pdf")
+    page_paths = []
     atlas.beginRender()
-    page_num = 0
+    has_page = atlas.first()
+    while has_page:
+        path = Path(atlas.filePath(base_path, ".pdf"))
+        page_paths.append((path, path.stat().st_mtime_ns if path.exists() else None))
+        has_page = atlas.next()
+    atlas.endRender()
     
-    while atlas.next():
-        page_num += 1
-        feature = atlas.layout().reportContext().feature()
-        
-        # Get region name from feature
-        try:
-            region_name = feature.attribute('name')
-            if not region_name or region_name == '':
-                region_name = f"region_{page_num}"
-        except:
-            region_name = f"region_{page_num}"
-        
-        logger.info(f"Exporting page {page_num}: {region_name}")
-        
-        # Clean region name for filename
-        safe_name = "".join(c if c.isalnum() or c in ('-', '_') else '_' for c in region_name)
-        individual_pdf_path = individual_dir / f"{safe_name}.pdf"
-        
-        result = exporter.exportToPdf(str(individual_pdf_path), pdf_settings)
-        
-        if result == QgsLayoutExporter.Success:
-            results['individual_pdfs'].append(str(individual_pdf_path))
-            logger.info(f"  ✓ Page {page_num}: {region_name}")
-        else:
-            error_msg = get_export_error_message(result)
-            logger.error(f"  ✗ Page {page_num} ({region_name}) failed: {error_msg}")
-            results['status'] = 'partial'
+    result, error = QgsLayoutExporter.exportToPdfs(atlas, base_path, pdf_settings)
     
-    atlas.endRender()
-    results['total_pages'] = page_num
+    results['individual_pdfs'] = [str(path) for path, old_mtime in page_paths
+                                  if path.exists() and path.stat().st_mtime_ns != old_mtime]
+    total_pages = atlas.count()
     
-    logger.info(f"Atlas export complete: {page_num} pages")
+    if result == QgsLayoutExporter.Success:
+        logger.info(f"✓ {len(results['individual_pdfs'])} individual PDFs exported")
+    else:
+        error_msg = get_export_error_message(result)
+        logger.error(f"✗ Individual PDF export failed: {error_msg} {error}")
+        results['status'] = 'partial'
+    
+    if len(results['individual_pdfs']) != total_pages:
+        logger.error(f"✗ Only {len(results['individual_pdfs'])} of {total_pages} individual PDFs were written")
+        results['status'] = 'partial'
+    
+    results['total_pages'] = total_pages
+    
+    logger.info(f"Atlas export complete: {total_pages} pages")
     return results
 
 
 def get_export_error_message(error_code):
     """Convert QgsLayoutExporter error code to human-readable message."""
-    error_map = {
-        0: "Success",
-        1: "Canceled",
-        2: "MemoryError",
-        3: "FileError",
-        4: "PrintError",
-        5: "SvgLayerError",
-        6: "IteratorError"
-    }
-    return error_map.get(error_code, f"Unknown error ({error_code})")
+    return outlets_qgis._PDF_EXPORT_ERROR_CODES.get(error_code, f"Unknown error ({error_code})")
 
 
 # Asset method registration
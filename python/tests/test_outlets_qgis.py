@@ -0,0 +1,235 @@
+import os
+import sys
+import unittest
+import tempfile
+import shutil
+import json
+import importlib.util
+from pathlib import Path
+import numpy as np
+
+# Add the python directory to the Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import outlets_qgis
+from outlets_qgis import (load_regions_from_geojson, regions_bbox_array, bbox_overlaps, clean_grass_geojson,
+                          collect_layer_attributions, fit_bboxes_to_aspect, clip_frame_rect, staged_copy_path,
+                          render_worker_count)
+
+HAVE_QGIS = importlib.util.find_spec('qgis') is not None
+
+class TestOutletsQgis(unittest.TestCase):
+    def setUp(self):
+        self.test_dir = tempfile.mkdtemp()
+
+        def box(west, south, east, north):
+            return [[[west, south], [east, south], [east, north], [west, north], [west, south]]]
+
+        self.test_geojson = {
+            "type": "FeatureCollection",
+            "features": [
+                {
+                    "type": "Feature",
+                    "geometry": {"type": "Polygon", "coordinates": box(-123.5, 39.0, -123.0, 39.5)},
+                    "properties": {"name": "North Fork"}
+                },
+                {
+                    "type": "Feature",
+                    "geometry": {"type": "Polygon", "coordinates": [[[-123.0, 39.0]]]},
+                    "properties": {"name": "Malformed"}
+                },
+                {
+                    "type": "Feature",
+                    "geometry": {"type": "Polygon", "coordinates": box(-123.0, 39.0, -122.5, 39.5)},
+                    "properties": {"Description": "South Fork"}
+                }
+            ]
+        }
+        self.test_geojson_path = Path(self.test_dir) / "regions.geojson"
+        with open(self.test_geojson_path, 'w') as f:
+            json.dump(self.test_geojson, f)
+
+    def tearDown(self):
+        shutil.rmtree(self.test_dir)
+
+    def test_load_regions_from_geojson(self):
+        regions = load_regions_from_geojson(self.test_geojson_path)
+
+        self.assertEqual(len(regions), 2)
+        self.assertEqual(regions[0]['bbox'], {
+            "west": -123.5,
+            "east": -123.0,
+            "north": 39.5,
+            "south": 39.0
+        })
+        self.assertEqual(regions[1]['bbox']['west'], -123.0)
+        self.assertEqual(regions[1]['bbox']['east'], -122.5)
+        self.assertEqual(regions[0]['neighbors'], {"prev": regions[1]['name'], "next": regions[1]['name']})
+
+    def test_load_regions_from_geojson_first_n(self):
+        regions = load_regions_from_geojson(self.test_geojson_path, first_n=1)
+
+        self.assertEqual(len(regions), 1)
+        self.assertEqual(regions[0]['neighbors'], {"prev": regions[0]['name'], "next": regions[0]['name']})
+
+    def test_regions_bbox_array(self):
+        regions = load_regions_from_geojson(self.test_geojson_path)
+
+        bounds = regions_bbox_array(regions)
+        self.assertEqual(bounds.shape, (2, 4))
+        self.assertEqual(bounds[0].tolist(), [-123.5, 39.0, -123.0, 39.5])
+        self.assertEqual(regions_bbox_array([]).shape, (0, 4))
+
+    def test_bbox_overlaps(self):
+        regions = np.array([[0, 0, 1, 1], [5, 5, 6, 6]], dtype=float)
+        layers = np.array([[1, 1, 2, 2], [-1, -1, 0.5, 0.5], [10, 10, 11, 11]], dtype=float)
+
+        overlaps = bbox_overlaps(regions, layers)
+        self.assertEqual(overlaps.tolist(), [[True, True, False], [False, False, False]])
+        self.assertEqual(bbox_overlaps(regions, np.zeros((0, 4))).shape, (2, 0))
+
+    def test_load_regions_from_geojson_missing(self):
+        regions = load_regions_from_geojson(Path(self.test_dir) / "missing.geojson")
+
+        self.assertEqual(regions, [])
+
+    def test_clean_grass_geojson(self):
+        grass_geojson = {
+            "type": "FeatureCollection",
+            "name": "roads",
+            "crs": {"type": "name", "properties": {"name": "urn:ogc:def:crs:EPSG::3310"}},
+            "features": [
+                {
+                    "type": "Feature",
+                    "id": 1,
+                    "geometry": {"type": "Point", "coordinates": [1.5, 2.0]},
+                    "properties": {"cat": 1, "fid": 7, "name": "Main St"}
+                }
+            ]
+        }
+        grass_path = Path(self.test_dir) / "roads.geojson"
+        cleaned_path = Path(self.test_dir) / "roads_clean.geojson"
+        with open(grass_path, 'w') as f:
+            json.dump(grass_geojson, f)
+
+        self.assertTrue(clean_grass_geojson(grass_path, cleaned_path))
+        with open(cleaned_path) as f:
+            cleaned = json.load(f)
+        self.assertEqual(cleaned['name'], "roads")
+        self.assertEqual(cleaned['crs'], grass_geojson['crs'])
+        self.assertEqual(cleaned['features'], [{
+            "type": "Feature",
+            "geometry": {"type": "Point", "coordinates": [1.5, 2.0]},
+            "properties": {"name": "Main St"}
+        }])
+
+        # An existing output is rewritten, never trusted by its mtime
+        with open(cleaned_path, 'w') as f:
+            f.write('{"type": "FeatureCollection", "features": []}')
+        self.assertTrue(clean_grass_geojson(grass_path, cleaned_path))
+        with open(cleaned_path) as f:
+            self.assertEqual(len(json.load(f)['features']), 1)
+
+    def test_staged_copy_path(self):
+        # Same layer name in two atlases: separate copies
+        paths = []
+        for atlas in ("atlas_a", "atlas_b"):
+            source = Path(self.test_dir) / atlas / "roads.geojson"
+            source.parent.mkdir()
+            source.write_text('{"type": "FeatureCollection", "features": []}')
+            paths.append(staged_copy_path("roads", source, source.stat(), ".fgb"))
+        self.assertNotEqual(paths[0], paths[1])
+        self.assertTrue(paths[0].name.startswith("roads_") and paths[0].suffix == ".fgb")
+
+        # A changed source gets a new copy, even with an older mtime
+        stat = source.stat()
+        source.write_text('{"type": "FeatureCollection", "features": [null]}')
+        os.utime(source, ns=(stat.st_atime_ns, stat.st_mtime_ns - 10**9))
+        self.assertNotEqual(staged_copy_path("roads", source, source.stat(), ".fgb"), paths[1])
+        self.assertEqual(staged_copy_path("roads", source, source.stat(), ".fgb"),
+                         staged_copy_path("roads", source, source.stat(), ".fgb"))
+
+    def test_fit_bboxes_to_aspect(self):
+        bounds = np.array([[0, 0, 1, 2], [0, 0, 4, 1], [0, 0, 2, 1]], dtype=float)
+
+        fitted = fit_bboxes_to_aspect(bounds, 2.0)
+        self.assertEqual(fitted.tolist(), [[-1.5, 0, 2.5, 2], [0, -0.5, 4, 1.5], [0, 0, 2, 1]])
+        self.assertEqual(fit_bboxes_to_aspect([], 1.0).shape, (0, 4))
+
+    def test_clip_frame_rect(self):
+        # A 1x2 region padded to a 4:2 extent sits in the middle of the frame
+        extent = fit_bboxes_to_aspect([[0, 0, 1, 2]], 2.0)[0]
+        self.assertEqual(clip_frame_rect((2, 2, 200, 100), extent, [0, 0, 1, 2]), (77.0, 2.0, 50.0, 100.0))
+        # Top edge of the page is the top of the extent
+        self.assertEqual(clip_frame_rect((0, 0, 10, 10), [0, 0, 10, 10], [2, 5, 4, 9]), (2.0, 1.0, 2.0, 4.0))
+
+    def test_render_worker_count(self):
+        self.assertEqual(render_worker_count({}), 1)
+        self.assertEqual(render_worker_count({'render_workers': 4}), 4)
+        self.assertEqual(render_worker_count({'render_workers': "4"}), 4)
+        self.assertEqual(render_worker_count({'render_workers': 'auto'}), os.cpu_count() or 1)
+        with self.assertLogs('outlets_qgis', level='ERROR'):
+            self.assertEqual(render_worker_count({'render_workers': 'all'}), 1)
+
+    def test_collect_layer_attributions(self):
+        config = {
+            "assets": {
+                "osm_roads": {"out_layer": "roads", "config_def": "osm"},
+                "usgs_roads": {"out_layer": "roads", "config_def": "usgs"},
+                "parcels": {"out_layer": "parcels", "config_def": "county"}
+            },
+            "inlets": {
+                "osm": {"attribution": {"description": "OpenStreetMap"}},
+                "usgs": {"attribution": {"description": "USGS"}},
+                "county": {"attribution": {"description": "County GIS"}}
+            }
+        }
+
+        attributions = collect_layer_attributions(config, {"in_layers": ["roads", "creeks"]})
+        self.assertEqual(attributions, ["OpenStreetMap", "USGS"])
+
+
+@unittest.skipUnless(HAVE_QGIS, "QGIS is not installed")
+class TestOutletsQgisLayers(unittest.TestCase):
+    def setUp(self):
+        self.test_dir = tempfile.mkdtemp()
+        self.config = {"name": "test_atlas", "data_root": self.test_dir}
+        self.layer_config = {"name": "places", "geometry_type": "point",
+                             "add_labels": True, "deduplicate_labels": True}
+
+        layer_dir = Path(self.test_dir) / "test_atlas" / "staging" / "layers" / "places"
+        layer_dir.mkdir(parents=True)
+        features = [
+            {"type": "Feature", "geometry": {"type": "Point", "coordinates": [x, 39.0]}, "properties": {"name": name}}
+            for x, name in [(-123.0, "Mill Creek"), (-122.9, "Mill Creek"), (-122.8, "Fish Rock")]
+        ]
+        with open(layer_dir / "places.geojson", 'w') as f:
+            json.dump({"type": "FeatureCollection", "features": features}, f)
+
+        outlets_qgis.qgis_init()
+
+    def tearDown(self):
+        outlets_qgis.qgis_cleanup()
+        shutil.rmtree(self.test_dir)
+
+    def kept_labels(self, layer):
+        return sorted(f['name'] for f in layer.getFeatures() if f[outlets_qgis.LABEL_KEEP_FIELD] == 1)
+
+    def test_deduplicated_labels_without_region_filter(self):
+        # The atlas outlet renders loaded layers without apply_region_filter
+        layer = outlets_qgis.load_full_layer(self.layer_config, self.config)
+        self.assertEqual(layer.name(), "places")
+        self.assertEqual(self.kept_labels(layer), ["Fish Rock", "Mill Creek"])
+
+        # A cached layer comes back flagged for the whole layer, not for the
+        # last region rendered from it
+        keep_idx = layer.fields().indexOf(outlets_qgis.LABEL_KEEP_FIELD)
+        layer.dataProvider().changeAttributeValues({f.id(): {keep_idx: 0} for f in layer.getFeatures()})
+        outlets_qgis._flag_first_labels(layer, [f.id() for f in layer.getFeatures() if f['name'] == "Fish Rock"])
+        self.assertEqual(self.kept_labels(layer), ["Fish Rock"])
+        cached = outlets_qgis.load_full_layer(self.layer_config, self.config)
+        self.assertIs(cached, layer)
+        self.assertEqual(self.kept_labels(cached), ["Fish Rock", "Mill Creek"])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -14,6 +14,8 @@ from utils import (
     bbox_to_corners,
     bbox_to_polygon,
     geojson_to_bbox,
+    morton_code,
+    bbox_morton_code,
     tiff2jpg,
     canonicalize_raster,
     resample_raster_gdal,
@@ -144,6 +146,23 @@ class TestUtils(unittest.TestCase):
         }
         self.assertEqual(geojson_to_bbox(geojson), expected)
 
+    def test_morton_code(self):
+        """Test Morton code bit interleaving"""
+        self.assertEqual(morton_code(0, 0), 0)
+        self.assertEqual(morton_code(1, 0), 1)
+        self.assertEqual(morton_code(0, 1), 2)
+        self.assertEqual(morton_code(3, 3), 15)
+        self.assertEqual(morton_code(2**32 - 1, 0), int('01' * 32, 2))
+
+    def test_bbox_morton_code(self):
+        """Test nearby bboxes get closer Morton codes than distant ones"""
+        def box(west, south):
+            return {"west": west, "south": south, "east": west + 0.1, "north": south + 0.1}
+        origin = bbox_morton_code(box(-73.5, 41.0))
+        near = bbox_morton_code(box(-73.4, 41.0))
+        far = bbox_morton_code(box(10.0, -30.0))
+        self.assertLess(abs(near - origin), abs(far - origin))
+
     @patch('subprocess.check_output')
     def test_tiff2jpg(self, mock_check_output):
         """Test TIFF to JPG conversion"""
@@ -1,5 +1,5 @@
 
-import logging, subprocess, json, copy
+import logging, subprocess, json, copy, functools
 import gspread, geojson
 
 # Configure logging
@@ -17,6 +17,7 @@ def rgb_to_css(rgb_tuple):
     else:
         logger.error(f"Unknown RGB tuple: {rgb_tuple}")
 
+@functools.lru_cache(maxsize=4096)
 def canonicalize_name(s):
     return "_".join(s.lower().split()).strip()    
     
@@ -47,6 +48,26 @@ def geojson_to_bbox(geojson):
         "south": min(vert)
     }
 
+def _spread_bits(v):
+    """Spread the low 32 bits of v so they occupy the even bit positions."""
+    v &= 0xFFFFFFFF
+    v = (v | (v << 16)) & 0x0000FFFF0000FFFF
+    v = (v | (v << 8)) & 0x00FF00FF00FF00FF
+    v = (v | (v << 4)) & 0x0F0F0F0F0F0F0F0F
+    v = (v | (v << 2)) & 0x3333333333333333
+    v = (v | (v << 1)) & 0x5555555555555555
+    return v
+
+def morton_code(x, y):
+    """Z-order (Morton) code interleaving the bits of two non-negative ints."""
+    return _spread_bits(x) | (_spread_bits(y) << 1)
+
+def bbox_morton_code(b):
+    """Morton code of a lat/long bbox's center, at ~1m resolution."""
+    lon = (b['west'] + b['east']) / 2
+    lat = (b['south'] + b['north']) / 2
+    return morton_code(int((lon + 180) * 1e5), int((lat + 90) * 1e5))
+
 def tiff2jpg(tiff_path, atlas_config=None, swale_config=None):
     """Convert TIFF to JPG using versioned paths"""
     # Construct JPG path